@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Union
 
 from pharmpy.deps import symengine, sympy
@@ -245,6 +246,8 @@ class Expr:
 
     @classmethod
     def symbol(cls, name: str) -> Expr:
+        if cls is Expr:
+            return _symbol(name)
         symb = symengine.Symbol(name)
         return cls(symb)
 
@@ -308,6 +311,12 @@ class Expr:
         return BooleanExpr(symengine.Le(self._expr, other))
 
 
+@lru_cache(maxsize=4096)
+def _symbol(name: str) -> Expr:
+    # Expr is immutable so symbols can be shared between all users of the same name
+    return Expr(symengine.Symbol(name))
+
+
 class BooleanExpr:
     # A boolean expression with all symbols real
     def __init__(self, source: TBooleanExpr):
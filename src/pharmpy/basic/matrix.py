@@ -17,6 +17,14 @@ class Matrix:
         else:
             self._m = symengine.Matrix(source)
 
+    @classmethod
+    def _from_symengine(cls, m: symengine.Matrix) -> Matrix:
+        # Wrap a newly created symengine matrix without copying it. The caller
+        # must not keep any other reference to m.
+        obj = cls.__new__(cls)
+        obj._m = m
+        return obj
+
     @overload
     def __getitem__(self, ind: tuple[int, int]) -> Expr: ...
 
@@ -54,7 +62,7 @@ class Matrix:
         return self._m.free_symbols
 
     def subs(self, d: Mapping) -> Matrix:
-        return Matrix(self._m.subs(d))
+        return Matrix._from_symengine(self._m.subs(d))
 
     @property
     def rows(self) -> int:
@@ -101,25 +109,25 @@ class Matrix:
         other = self._convert_input(other)
         if not isinstance(other, Matrix):
             return NotImplemented
-        return Matrix(self._m + other)
+        return Matrix._from_symengine(self._m + other)
 
     def __radd__(self, other) -> Matrix:
         other = self._convert_input(other)
         if not isinstance(other, Matrix):
             return NotImplemented
-        return Matrix(self._m + other)
+        return Matrix._from_symengine(self._m + other)
 
     def __matmul__(self, other) -> Matrix:
         other = self._convert_input(other)
         if not isinstance(other, Matrix):
             return NotImplemented
-        return Matrix(self._m @ other)
+        return Matrix._from_symengine(self._m @ other)
 
     def __rmatmul__(self, other) -> Matrix:
         other = self._convert_input(other)
         if not isinstance(other, Matrix):
             return NotImplemented
-        return Matrix(other._m @ self._m)
+        return Matrix._from_symengine(other._m @ self._m)
 
     @staticmethod
     def _convert_input(m):
@@ -155,7 +163,7 @@ class Matrix:
         return ud
 
     def cholesky(self) -> Matrix:
-        return Matrix(self._m.cholesky())
+        return Matrix._from_symengine(self._m.cholesky())
 
     def __getstate__(self):
         state = self.__dict__.copy()
@@ -1,9 +1,11 @@
 from abc import ABC
 from collections.abc import Mapping
+from functools import wraps
 from typing import Iterator, TypeVar
 
 
 def cache_method(func):
+    """Cache the result of a method without arguments on the (immutable) instance"""
     if func.__name__ == '__hash__':
 
         def wrapper(self):
@@ -14,6 +16,19 @@ def cache_method(func):
                 self._hash = h
                 return h
 
+        return wrapper
+    elif func.__code__.co_argcount == 1:
+        attr = f'_cached{func.__name__}'
+
+        @wraps(func)
+        def wrapper(self):
+            try:
+                return self.__dict__[attr]
+            except KeyError:
+                value = func(self)
+                self.__dict__[attr] = value
+                return value
+
         return wrapper
     else:
         return func
@@ -26,6 +41,12 @@ class Immutable(ABC):
     def __deepcopy__(self, _):
         return self
 
+    def __getstate__(self):
+        # NOTE: A cached hash can depend on the str hash seed of the process that computed it
+        state = self.__dict__.copy()
+        state.pop('_hash', None)
+        return state
+
 
 K = TypeVar('K')
 V = TypeVar('V')
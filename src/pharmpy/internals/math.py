@@ -156,6 +156,18 @@ def nearest_positive_semidefinite(A):
     return A3
 
 
+def positive_semidefinite_factors(A):
+    """Factorize a stack of symmetric matrices into F with F @ F.T positive semidefinite
+
+    A has the shape (..., n, n). All matrices are symmetrized and decomposed with one
+    batched eigendecomposition. Negative eigenvalues are clipped to zero which gives
+    the nearest positive semidefinite matrix in the Frobenius norm as F @ F.T.
+    """
+    A = (A + np.swapaxes(A, -1, -2)) / 2
+    eigvals, eigvecs = np.linalg.eigh(A)
+    return eigvecs * np.sqrt(np.clip(eigvals, 0, None))[..., np.newaxis, :]
+
+
 def nearest_positive_definite(A):
     # Find the (almost) nearest positive definite matrix given a positive semidefinite matrix
     A = A.copy()
@@ -206,7 +218,8 @@ def conditional_joint_normal_lambda(mu, sigma, n):
     sigma_bar = S11 - S12_at_S22_inv @ S21
 
     def _cjn_eval(a):
-        mu_bar = M1 + S12_at_S22_inv @ (a - M2)
+        # NOTE: a can also be a matrix with one condition per row
+        mu_bar = M1 + (a - M2) @ S12_at_S22_inv.T
         return mu_bar, sigma_bar
 
     return _cjn_eval
@@ -993,15 +993,14 @@ class DataInfo(Sequence, Immutable):
         if path is None:
             return json.dumps(self._to_dict(str(self.path) if self.path is not None else None))
         else:
+            d = self._to_dict(
+                str(path_relative_to(Path(path).parent, self.path))
+                if self.path is not None
+                else None
+            )
+            # NOTE: Encode in one go instead of writing the chunks from json.dump one by one
             with open(path, 'w') as fp:
-                json.dump(
-                    self._to_dict(
-                        str(path_relative_to(Path(path).parent, self.path))
-                        if self.path is not None
-                        else None
-                    ),
-                    fp,
-                )
+                fp.write(json.dumps(d))
 
     @staticmethod
     def from_json(s: str) -> DataInfo:
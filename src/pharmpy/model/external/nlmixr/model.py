@@ -1,18 +1,25 @@
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import pharmpy.model
+from pharmpy.deps import pandas as pd
 from pharmpy.internals.code_generator import CodeGenerator
 from pharmpy.model import Assignment, Compartment, get_and_check_dataset, get_and_check_odes
 from pharmpy.model.model import ModelInternals
-from pharmpy.modeling import drop_columns, get_evid, translate_nmtran_time
+from pharmpy.modeling import get_evid, translate_nmtran_time
 
 from .error_model import res_error_term
 from .ini import add_eta, add_sigma, add_theta
 from .model_block import add_bio_lag, add_ode, add_statements
 from .sanity_checks import check_model
 
+# Data items that nlmixr expects in lowercase
+_LOWERCASE_TOKENS = re.compile(r'\b(?:AMT|TIME)\b')
+
+_NONMEM_METHOD_TO_NLMIXR = {"FOCE": "foce", "FO": "fo", "SAEM": "saem"}
+
 
 def convert_model(
     model: pharmpy.model.Model,
@@ -57,13 +64,13 @@ def convert_model(
         # FIXME: Dropping columns runs update source which becomes redundant.
         # drop_dropped_columns(nlmixr_model)
         df = get_and_check_dataset(nlmixr_model)
-        if all(x in df.columns for x in ("RATE", "DUR")):
-            nlmixr_model = drop_columns(nlmixr_model, ["DUR"])
-            df = get_and_check_dataset(nlmixr_model)
-        nlmixr_model = nlmixr_model.replace(
-            datainfo=nlmixr_model.datainfo.replace(path=None),
-            dataset=df.reset_index(drop=True),
-        )
+        di = nlmixr_model.datainfo
+        if {"RATE", "DUR"}.issubset(df.columns):
+            df = df.drop(columns=["DUR"])
+            di = di.replace(columns=[col for col in di if col.name != "DUR"])
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            df = df.reset_index(drop=True)
+        nlmixr_model = nlmixr_model.replace(datainfo=di.replace(path=None), dataset=df)
 
         # Add evid
         nlmixr_model = add_evid(nlmixr_model)
@@ -71,7 +78,7 @@ def convert_model(
     # Check model for warnings regarding data structure or model contents
     nlmixr_model = check_model(nlmixr_model, skip_error_model_check=skip_check)
 
-    nlmixr_model.update_source()
+    nlmixr_model = nlmixr_model.update_source()
 
     return nlmixr_model
 
@@ -238,12 +245,7 @@ def create_fit(cg: CodeGenerator, model: pharmpy.model.Model) -> None:
     method = execution_steps.method
     interaction = execution_steps.interaction
 
-    nonmem_method_to_nlmixr = {"FOCE": "foce", "FO": "fo", "SAEM": "saem"}
-
-    if method not in nonmem_method_to_nlmixr.keys():
-        nlmixr_method = "focei"
-    else:
-        nlmixr_method = nonmem_method_to_nlmixr[method]
+    nlmixr_method = _NONMEM_METHOD_TO_NLMIXR.get(method, "focei")
 
     if interaction and nlmixr_method != "saem":
         nlmixr_method += "i"
@@ -265,11 +267,9 @@ def create_fit(cg: CodeGenerator, model: pharmpy.model.Model) -> None:
 
 def add_evid(model: pharmpy.model.Model) -> pharmpy.model.Model:
     df = get_and_check_dataset(model)
-    if "EVID" not in df.columns:
-        df = df.copy()
-        df["EVID"] = get_evid(model)
-        model = model.replace(dataset=df)
-    return model
+    if "EVID" in df.columns:
+        return model
+    return model.replace(dataset=df.assign(EVID=get_evid(model).to_numpy()))
 
 
 @dataclass(frozen=True)
@@ -287,6 +287,10 @@ class Model(pharmpy.model.Model):
         )
 
     def update_source(self):
+        # Models are immutable so the generated code can be kept on the instance
+        code = getattr(self, '_code', None)
+        if code is not None and self.internals.src == code:
+            return self
         cg = CodeGenerator()
         cg.add(f'{self.name} <- function() {{')
         cg.indent()
@@ -298,19 +302,23 @@ class Model(pharmpy.model.Model):
         create_fit(cg, self)
         # Create lowercase id, time and amount symbols for nlmixr to be able
         # to run
-        code = str(cg).replace("AMT", "amt").replace("TIME", "time")
+        code = _LOWERCASE_TOKENS.sub(lambda m: m.group(0).lower(), str(cg))
         path = None
         internals = self.internals
         assert internals is not None
         internals = internals.replace(src=code, path=path)
         model = self.replace(internals=internals)
+        model._code = code
         return model
 
     @property
     def code(self):
-        model = self.update_source()
-        internals = model.internals
-        assert isinstance(internals, NLMIXRModelInternals)
-        code = internals.src
-        assert code is not None
+        code = getattr(self, '_code', None)
+        if code is None:
+            model = self.update_source()
+            internals = model.internals
+            assert isinstance(internals, NLMIXRModelInternals)
+            code = internals.src
+            assert code is not None
+            self._code = code
         return code
@@ -5,7 +5,7 @@ from typing import Union
 
 import pharmpy.model
 from pharmpy.basic import BooleanExpr
-from pharmpy.deps import sympy, sympy_printing
+from pharmpy.deps import symengine, sympy
 from pharmpy.internals.code_generator import CodeGenerator
 from pharmpy.model import Assignment, Infusion, Statements, get_and_check_odes
 from pharmpy.modeling import get_bioavailability, get_lag_times
@@ -14,26 +14,6 @@ from .error_model import res_error_term
 from .name_mangle import name_mangle
 
 
-class ExpressionPrinter(sympy_printing.str.StrPrinter):
-    def __init__(self, amounts):
-        self.amounts = amounts
-        super().__init__()
-
-    def _print_Symbol(self, expr):
-        return name_mangle(expr.name)
-
-    def _print_Derivative(self, expr):
-        fn = expr.args[0]
-        return f'd/dt({fn.name})'
-
-    def _print_Function(self, expr):
-        name = expr.func.__name__
-        if name in self.amounts:
-            return expr.func.__name__
-        else:
-            return expr.func.__name__ + f'({self.stringify(expr.args, ", ")})'
-
-
 def add_statements(
     model: pharmpy.model.Model,
     cg: CodeGenerator,
@@ -338,20 +318,21 @@ def add_ode(model: pharmpy.model.Model, cg: CodeGenerator) -> None:
         Codegenerator object holding the code to be added to.
     """
     odes = get_and_check_odes(model)
-    amounts = [am.name for am in list(odes.amounts)]
-    printer = ExpressionPrinter(amounts)
+    # Amounts are printed without their time argument and symbol names are mangled
+    subs = {symengine.sympify(amount): symengine.Symbol(amount.name) for amount in odes.amounts}
+    for eq in odes.eqs:
+        for symb in eq.rhs.free_symbols:
+            mangled = name_mangle(symb.name)
+            if mangled != symb.name:
+                subs[symengine.sympify(symb)] = symengine.Symbol(mangled)
 
     for eq in odes.eqs:
+        lhs = f'd/dt({eq.lhs.args[0].name})'
+        rhs = _print_expr(eq.rhs, subs)
         # Should remove piecewise from these equations in nlmixr
         if eq.atoms(sympy.Piecewise):
-            lhs = remove_piecewise(printer.doprint(sympy.sympify(eq.lhs)))
-            rhs = remove_piecewise(printer.doprint(sympy.sympify(eq.rhs)))
-
-            cg.add(f'{lhs} = {rhs}')
-        else:
-            cg.add(
-                f'{printer.doprint(sympy.sympify(eq.lhs))} = {printer.doprint(sympy.sympify(eq.rhs))}'
-            )
+            rhs = remove_piecewise(rhs)
+        cg.add(f'{lhs} = {rhs}')
 
     for comp in odes.dosing_compartments:
         # FIXME : Handle multiple doses with different dur/rate
@@ -363,6 +344,10 @@ def add_ode(model: pharmpy.model.Model, cg: CodeGenerator) -> None:
                 cg.add(f'rate({comp.amount.name}) = {rate}')
 
 
+def _print_expr(expr, subs) -> str:
+    return str(symengine.sympify(expr).xreplace(subs))
+
+
 def remove_piecewise(expr: str) -> str:
     """
     Return an expression without Piecewise statements
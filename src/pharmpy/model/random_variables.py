@@ -765,6 +765,39 @@ class RandomVariables(CollectionsSequence, Immutable):
                     return False
         return True
 
+    def validate_parameter_samples(self, names: Sequence[str], samples: np.ndarray) -> np.ndarray:
+        """Validate many samples of parameter values at once
+
+        Same check as validate_parameters, but for a two dimensional array having one
+        sample per row and the values of the parameters in names as columns.
+
+        Returns a boolean array with one element per sample
+        """
+        positions = {name: i for i, name in enumerate(names)}
+        valid = np.ones(len(samples), dtype=bool)
+        for dist in self._dists:
+            if not isinstance(dist, JointNormalDistribution):
+                continue
+            sigma = dist.variance
+            covs = np.empty((len(samples), sigma.rows, sigma.cols))
+            for row in range(sigma.rows):
+                for col in range(sigma.cols):
+                    elt = sigma[row, col]
+                    if elt.is_symbol() and elt.name in positions:
+                        covs[:, row, col] = samples[:, positions[elt.name]]
+                    elif elt.is_number():
+                        covs[:, row, col] = float(elt)
+                    else:
+                        # Element is not given by a single parameter
+                        return np.fromiter(
+                            (self.validate_parameters(dict(zip(names, x))) for x in samples),
+                            dtype=bool,
+                            count=len(samples),
+                        )
+            eigvals = np.linalg.eigvals(covs)
+            valid &= np.all(eigvals >= 0, axis=-1)
+        return valid
+
     def sample(
         self,
         expr,
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Optional, Self, Union, overload
 
@@ -38,6 +40,10 @@ class Statement(Immutable):
     def subs(self, substitutions: Mapping[Expr, Expr]) -> Statement:
         pass
 
+    def _subs_prepared(self, substitutions: dict) -> Statement:
+        # Substitute using a dict already converted by _sympify_substitutions
+        return self.subs(substitutions)
+
     @property
     @abstractmethod
     def free_symbols(self) -> set[Expr]:
@@ -48,6 +54,11 @@ class Statement(Immutable):
     def rhs_symbols(self) -> set[Expr]:
         pass
 
+    @abstractmethod
+    def _defined_symbols(self) -> frozenset[Expr]:
+        # Symbols or amounts defined by the statement
+        pass
+
 
 class Assignment(Statement):
     """Representation of variable assignment
@@ -116,6 +127,11 @@ class Assignment(Statement):
         CL = ETA_CL⋅WGT + POP_CL
 
         """
+        return self._subs_prepared(_sympify_substitutions(substitutions))
+
+    def _subs_prepared(self, substitutions: dict) -> Assignment:
+        if _substitutes_none_of(substitutions, self._free_symbols()):
+            return self
         symbol = self.symbol.subs(substitutions)
         expression = self.expression.subs(substitutions)
         expression = expression.piecewise_fold()
@@ -135,9 +151,15 @@ class Assignment(Statement):
         {CL, ETA_CL, POP_CL}
 
         """
-        symbols = {self.symbol}
-        symbols |= self.expression.free_symbols
-        return symbols
+        return set(self._free_symbols())
+
+    @cache_method
+    def _free_symbols(self) -> frozenset[Expr]:
+        return frozenset({self._symbol} | self._expression.free_symbols)
+
+    @cache_method
+    def _defined_symbols(self) -> frozenset[Expr]:
+        return frozenset((self._symbol,))
 
     @property
     def rhs_symbols(self) -> set[Expr]:
@@ -151,13 +173,17 @@ class Assignment(Statement):
         {ETA_CL, POP_CL}
 
         """
+        return set(self._rhs_symbols())
+
+    @cache_method
+    def _rhs_symbols(self) -> frozenset[Expr]:
         prefuncs = self._expression._sympy_().atoms(sympy.Function)
         from sympy.core.function import AppliedUndef
 
         # Allow applied undefined functions
         funcs = {Expr(f) for f in prefuncs if isinstance(f, AppliedUndef)}
         symbols = self._expression.free_symbols
-        return funcs | symbols
+        return frozenset(funcs | symbols)
 
     def __eq__(self, other: Any):
         if not isinstance(other, Assignment):
@@ -183,18 +209,16 @@ class Assignment(Statement):
             symbol=Expr.deserialize(d['symbol']), expression=Expr.deserialize(d['expression'])
         )
 
+    @cache_method
     def __repr__(self):
         expression = self._expression.unicode()
         lines = [line.rstrip() for line in expression.split('\n')]
         definition = f'{self._symbol.unicode()} = '
-        s = ''
-        for line in lines:
-            if line == lines[-1]:
-                s += definition + line + '\n'
-            else:
-                s += len(definition) * ' ' + line + '\n'
-        return s.rstrip()
+        indent = len(definition) * ' '
+        lines = [indent + line for line in lines[:-1]] + [definition + lines[-1]]
+        return '\n'.join(lines).rstrip()
 
+    @cache_method
     def _repr_latex_(self) -> str:
         sym = self._symbol.latex()
         expr = self._expression.latex()
@@ -527,6 +551,22 @@ class CompartmentalSystemBuilder:
         return None
 
 
+def _reachable_nodes(adjacency, sources) -> set:
+    """All nodes reachable from any of the sources (including the sources)
+
+    adjacency[i] are the direct successors of node i. Nodes shared between the sources
+    are only visited once.
+    """
+    reached = set()
+    stack = list(sources)
+    while stack:
+        node = stack.pop()
+        if node not in reached:
+            reached.add(node)
+            stack.extend(adjacency[node])
+    return reached
+
+
 def _is_positive(expr: sympy.Expr) -> bool:
     return (
         sympy.ask(
@@ -540,6 +580,22 @@ def _comps(graph):
     return {comp for comp in graph.nodes if not isinstance(comp, Output)}
 
 
+def _sympify_substitutions(substitutions) -> dict:
+    # Convert keys and values once so that repeated substitutions into many
+    # expressions do not have to redo the conversion for every call
+    return {
+        symengine.sympify(key): symengine.sympify(value) for key, value in substitutions.items()
+    }
+
+
+def _substitutes_none_of(substitutions: dict, free_symbols: frozenset[Expr]) -> bool:
+    # Only plain symbols can be checked against the free symbols. Other keys
+    # could match subexpressions and need a real substitution.
+    return all(
+        isinstance(key, symengine.Symbol) and key not in free_symbols for key in substitutions
+    )
+
+
 def to_compartmental_system(names, eqs: Sequence[sympy.Eq]) -> CompartmentalSystem:
     """Convert an list of odes to a compartmental system
 
@@ -559,6 +615,13 @@ def to_compartmental_system(names, eqs: Sequence[sympy.Eq]) -> CompartmentalSyst
         compartments[name] = comp
 
     neweqs = list(eqs)  # Remaining flows
+    # Terms of the expanded original right hand sides, used to find the matching
+    # negative term of each flow
+    expanded_terms = [set(sympy.Add.make_args(sympy.expand(eq.rhs))) for eq in eqs]
+    expanded_terms_by_name = {
+        eq.lhs.args[0].name: terms  # pyright: ignore [reportAttributeAccessIssue]
+        for eq, terms in zip(eqs, expanded_terms)
+    }
 
     for eq in eqs:
         rhs = eq.rhs
@@ -570,35 +633,29 @@ def to_compartmental_system(names, eqs: Sequence[sympy.Eq]) -> CompartmentalSyst
                 assert isinstance(term, sympy.Expr)
                 from_comp = None
                 to_comp = None
-                if len(concentrations.intersection(free_images(term))) >= 2:
+                term_comps = concentrations.intersection(free_images(term))
+                if len(term_comps) >= 2:
                     # This means second order absorption -> find matching term
                     # to determine flow
                     if _is_positive(term):
-                        for second_comp in concentrations.intersection(free_images(term)):
-                            for eq_2 in eqs:
-                                if (
-                                    eq_2.lhs.args[
-                                        0
-                                    ].name  # pyright: ignore [reportAttributeAccessIssue]
-                                    == second_comp.name
-                                ):
-                                    # If this is False, then input to compartment is of second order
-                                    if -term in sympy.Add.make_args(sympy.expand(eq_2.rhs)):
-                                        from_comp = compartments[names[Expr(second_comp)]]
-                                        to_comp = compartments[names[Expr(eq.lhs.args[0])]]
+                        for second_comp in term_comps:
+                            terms_2 = expanded_terms_by_name.get(second_comp.name)
+                            # If this is False, then input to compartment is of second order
+                            if terms_2 is not None and -term in terms_2:
+                                from_comp = compartments[names[Expr(second_comp)]]
+                                to_comp = compartments[names[Expr(eq.lhs.args[0])]]
                 else:
                     # Find matching term to determine if flow is between
                     # compartments or not
                     if _is_positive(term):
-                        for eq_2 in eqs:
-                            if -term in sympy.Add.make_args(sympy.expand(eq_2.rhs)):
+                        for eq_2, terms_2 in zip(eqs, expanded_terms):
+                            if -term in terms_2:
                                 from_comp = compartments[names[Expr(eq_2.lhs.args[0])]]
                                 to_comp = compartments[names[Expr(eq.lhs.args[0])]]
 
                 if from_comp is not None and to_comp is not None:
-                    # FIXME: Get current flow from builder instead?
-                    cs = CompartmentalSystem(cb)
-                    current_flow = cs.get_flow(from_comp, to_comp)
+                    edge = cb._g.get_edge_data(from_comp, to_comp)
+                    current_flow = 0 if edge is None else edge['rate']
                     if current_flow == 0:
                         cb.add_flow(from_comp, to_comp, term / comp_func)
                     else:
@@ -716,13 +773,29 @@ class CompartmentalSystem(Statement):
     @property
     def eqs(self) -> tuple[BooleanExpr, ...]:
         """Tuple of equations"""
-        amount_funcs = Matrix(list(self.amounts))
-        derivatives = Matrix([Expr.derivative(fn, self.t) for fn in amount_funcs])
-        inputs = self.zero_order_inputs
-        a = self.compartmental_matrix @ amount_funcs + inputs
+        nodes = self._order_compartments()
+        index = {comp: i for i, comp in enumerate(nodes)}
+        amounts = [comp.amount._expr for comp in nodes]
+        # Accumulate the right hand sides directly from the flows instead of
+        # multiplying the full compartmental matrix with the amounts
+        rhs = [comp.input._expr for comp in nodes]
+        outflows = [symengine.Integer(0)] * len(nodes)
+        for from_comp, to_comp, rate in self._g.edges.data('rate'):
+            i = index[from_comp]
+            outflows[i] -= rate._expr
+            j = index.get(to_comp)
+            if j is not None and i != j:
+                rhs[j] += rate._expr * amounts[i]
+        for i, amount in enumerate(amounts):
+            rhs[i] += outflows[i] * amount
         eqs = [
-            BooleanExpr(sympy.Eq(lhs, canonical_ode_rhs(rhs._sympy_())))
-            for lhs, rhs in zip(derivatives, a)
+            BooleanExpr(
+                sympy.Eq(
+                    Expr.derivative(Expr(amount), self.t),
+                    canonical_ode_rhs(sympy.sympify(expr)),
+                )
+            )
+            for amount, expr in zip(amounts, rhs)
         ]
         return tuple(eqs)
 
@@ -742,12 +815,20 @@ class CompartmentalSystem(Statement):
         >>> model.statements.ode_system.free_symbols  # doctest: +SKIP
         {AMT, CL, V, t}
         """
-        free = {Expr.symbol('t')}
-        for _, _, rate in self._g.edges.data('rate'):
-            free |= rate.free_symbols
-        for node in _comps(self._g):
-            free |= node.free_symbols
-        return free
+        return set(self._free_symbols())
+
+    @cache_method
+    def _free_symbols(self) -> frozenset[Expr]:
+        return frozenset(
+            {Expr.symbol('t')}.union(
+                *(rate.free_symbols for _, _, rate in self._g.edges.data('rate')),
+                *(node.free_symbols for node in _comps(self._g)),
+            )
+        )
+
+    @cache_method
+    def _defined_symbols(self) -> frozenset[Expr]:
+        return frozenset(self.amounts)
 
     @property
     def rhs_symbols(self) -> set[Expr]:
@@ -780,11 +861,16 @@ class CompartmentalSystem(Statement):
         │CENTRAL│──CL/V→
         └───────┘
         """
+        return self._subs_prepared(_sympify_substitutions(substitutions))
+
+    def _subs_prepared(self, substitutions: dict) -> CompartmentalSystem:
+        if _substitutes_none_of(substitutions, self._free_symbols() | {self._t}):
+            return self
         cb = CompartmentalSystemBuilder(self)
         for u, v, rate in cb._g.edges.data('rate'):
             rate_sub = rate.subs(substitutions)
             cb._g.edges[u, v]['rate'] = rate_sub
-        mapping = {comp: comp.subs(substitutions) for comp in _comps(self._g)}
+        mapping = {comp: comp._subs_prepared(substitutions) for comp in _comps(self._g)}
         nx.relabel_nodes(cb._g, mapping, copy=False)
         return CompartmentalSystem(cb)
 
@@ -793,10 +879,22 @@ class CompartmentalSystem(Statement):
             return True
         if not isinstance(other, CompartmentalSystem):
             return NotImplemented
-        return self._t == other._t and nx.to_dict_of_dicts(self._g) == nx.to_dict_of_dicts(other._g)
+        if len(self._g) != len(other._g) or self._g.number_of_edges() != other._g.number_of_edges():
+            return False
+        return self._t == other._t and self._edge_signature() == other._edge_signature()
 
+    @cache_method
     def __hash__(self):
-        return hash((self._t, self._g))
+        return hash((self._t, self._edge_signature()))
+
+    @cache_method
+    def _edge_signature(self) -> tuple[frozenset, frozenset]:
+        return frozenset(self._g.nodes), frozenset(self._g.edges.data('rate'))
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop('_cached_edge_signature', None)
+        return state
 
     def to_dict(self) -> dict[str, Any]:
         comps = [comp for comp in self._g.nodes]
@@ -869,9 +967,8 @@ class CompartmentalSystem(Statement):
         >>> odes.get_flow(central, depot)
         0
         """
-        try:
-            rate = self._g.edges[source, destination]['rate']
-        except KeyError:
+        rate = self._outflows().get(source, {}).get(destination)
+        if rate is None:
             rate = Expr.integer(0)
         return rate
 
@@ -898,11 +995,7 @@ class CompartmentalSystem(Statement):
         [(Output(), CL/V)]
         """
         compartment = self.find_compartment_or_raise(compartment)
-        flows = []
-        for node in self._g.successors(compartment):
-            flow = self.get_flow(compartment, node)
-            flows.append((node, flow))
-        return flows
+        return list(self._outflows()[compartment].items())
 
     def get_compartment_inflows(
         self, compartment: Union[CompartmentBase, str]
@@ -933,11 +1026,25 @@ class CompartmentalSystem(Statement):
                 raise ValueError(f"Cannot find compartment {compartment}")
         else:
             destination = compartment
-        flows = []
-        for node in self._g.predecessors(destination):
-            flow = self.get_flow(node, destination)
-            flows.append((node, flow))
-        return flows
+        try:
+            flows = self._inflows()[destination]
+        except KeyError:
+            raise nx.NetworkXError(f"The node {destination} is not in the digraph.")
+        return list(flows)
+
+    @cache_method
+    def _outflows(self) -> dict[CompartmentBase, dict[CompartmentBase, Expr]]:
+        return {
+            node: {succ: data['rate'] for succ, data in succs.items()}
+            for node, succs in self._g.succ.items()
+        }
+
+    @cache_method
+    def _inflows(self) -> dict[CompartmentBase, tuple[tuple[Compartment, Expr], ...]]:
+        return {
+            node: tuple((pred, data['rate']) for pred, data in preds.items())
+            for node, preds in self._g.pred.items()
+        }
 
     def get_bidirectionals(self, compartment: Union[CompartmentBase, str]) -> list[Compartment]:
         """Get list of all compartments with bidirectional flow from/to a compartment
@@ -961,11 +1068,8 @@ class CompartmentalSystem(Statement):
         []
         """
         compartment = self.find_compartment_or_raise(compartment)
-        comps = []
-        for node in self._g.predecessors(compartment):
-            if self._g.has_edge(compartment, node):
-                comps.append(node)
-        return comps
+        outflows = self._outflows()[compartment]
+        return [node for node, _ in self._inflows()[compartment] if node in outflows]
 
     def find_compartment(self, name: str) -> Optional[Compartment]:
         """Find a compartment using its name
@@ -988,11 +1092,11 @@ class CompartmentalSystem(Statement):
         >>> central
         Compartment(CENTRAL, amount=A_CENTRAL(t), doses=Bolus(AMT, admid=1))
         """
-        for comp in _comps(self._g):
-            if comp.name == name:
-                return comp
-        else:
-            return None
+        return self._compartments_by_name().get(name)
+
+    @cache_method
+    def _compartments_by_name(self) -> dict[str, Compartment]:
+        return {comp.name: comp for comp in _comps(self._g)}
 
     def find_compartment_or_raise(self, comp: Union[str, CompartmentBase]) -> Compartment:
         if isinstance(comp, CompartmentBase):
@@ -1027,6 +1131,7 @@ class CompartmentalSystem(Statement):
         return len((out_comps | in_comps) - {output})
 
     @property
+    @cache_method
     def dosing_compartments(self) -> tuple[Compartment, ...]:
         """The dosing compartment(s)
 
@@ -1064,6 +1169,7 @@ class CompartmentalSystem(Statement):
         raise ValueError('No dosing compartment exists')
 
     @property
+    @cache_method
     def central_compartment(self) -> Compartment:
         """The central compartment
 
@@ -1121,10 +1227,14 @@ class CompartmentalSystem(Statement):
                 raise ValueError(f"{name} is not a name of an existing compartment")
         else:
             central = self.central_compartment
-        oneout = {node for node, out_degree in self._g.out_degree() if out_degree == 1}
-        onein = {node for node, in_degree in self._g.in_degree() if in_degree == 1}
-        cout = {comp for comp in oneout if self.get_flow(comp, central) != 0}
-        cin = {comp for comp in onein if self.get_flow(central, comp) != 0}
+        outflows = self._outflows()
+        inflows = self._inflows()
+        cout = {comp for comp, rate in inflows[central] if len(outflows[comp]) == 1 and rate != 0}
+        cin = {
+            comp
+            for comp, rate in outflows[central].items()
+            if len(inflows[comp]) == 1 and rate != 0
+        }
         peripherals = list(cout & cin)
         # Return in deterministic order
         peripherals = sorted(peripherals, key=lambda comp: comp.name)
@@ -1159,7 +1269,9 @@ class CompartmentalSystem(Statement):
             return transits
         transits.append(comp)
         comp, rate = outflows[0]
-        rate = statements.before_odes.full_expression(rate)
+        before_odes = statements.before_odes
+        # Only expand the rates when they are not trivially the same
+        full_rate = None
         while True:
             if len(self.get_compartment_inflows(comp)) != 1:
                 break
@@ -1167,9 +1279,11 @@ class CompartmentalSystem(Statement):
             if len(outflows) != 1:
                 break
             next_comp, next_rate = outflows[0]
-            next_rate = statements.before_odes.full_expression(next_rate)
-            if rate != next_rate:
-                break
+            if next_rate != rate:
+                if full_rate is None:
+                    full_rate = before_odes.full_expression(rate)
+                if full_rate != before_odes.full_expression(next_rate):
+                    break
             transits.append(comp)
             comp = next_comp
         # Special case of one transit directly into central is not defined as a transit
@@ -1232,6 +1346,7 @@ class CompartmentalSystem(Statement):
         return depot
 
     @property
+    @cache_method
     def compartmental_matrix(self) -> Matrix:
         """Compartmental matrix of the compartmental system
 
@@ -1245,20 +1360,18 @@ class CompartmentalSystem(Statement):
         ⎣ V  ⎦
         """
         nodes = self._order_compartments()
+        index = {comp: i for i, comp in enumerate(nodes)}
         size = len(nodes)
-        f = symengine.zeros(size)
-        for i in range(0, size):
-            from_comp = nodes[i]
-            diagsum = 0
-            for j in range(0, size):
-                to_comp = nodes[j]
-                rate = self.get_flow(from_comp, to_comp)
-                if i != j:
-                    f[j, i] = rate
-                diagsum -= rate
-            outrate = self.get_flow(from_comp, output)
-            f[i, i] = diagsum - outrate
-        return Matrix(f)
+        # Row major elements of the matrix
+        elements = [symengine.Integer(0)] * (size * size)
+        for from_comp, to_comp, rate in self._g.edges.data('rate'):
+            i = index[from_comp]
+            rate = rate._expr
+            j = index.get(to_comp)
+            if j is not None and i != j:
+                elements[j * size + i] = rate
+            elements[i * size + i] -= rate
+        return Matrix._from_symengine(symengine.Matrix(size, size, elements))
 
     @property
     def amounts(self) -> Matrix:
@@ -1273,8 +1386,8 @@ class CompartmentalSystem(Statement):
         [A_CENTRAL(t)]
         """
         ordered_cmts = self._order_compartments()
-        amts = [cmt.amount for cmt in ordered_cmts]
-        return Matrix(amts)
+        amts = [cmt.amount._expr for cmt in ordered_cmts]
+        return Matrix._from_symengine(symengine.Matrix(amts))
 
     @property
     def compartment_names(self) -> list[str]:
@@ -1291,14 +1404,15 @@ class CompartmentalSystem(Statement):
         names = [cmt.name for cmt in ordered_cmts]
         return names
 
+    @cache_method
     def _order_compartments(self):
-        """Return list of all compartments in canonical order"""
+        """Return tuple of all compartments in canonical order"""
         try:
             dosecmt = self.dosing_compartments[0]
         except ValueError:
             # Fallback for cases where no dose is available (yet)
             comps = list(_comps(self._g))
-            return sorted(comps, key=lambda comp: comp.name)
+            return tuple(sorted(comps, key=lambda comp: comp.name))
         # Order compartments
 
         def sortfunc(x):
@@ -1324,7 +1438,7 @@ class CompartmentalSystem(Statement):
                     nodes.append(c)
                     if c != comp:
                         remaining.remove(c)
-        return nodes
+        return tuple(nodes)
 
     @property
     def zero_order_inputs(self) -> Matrix:
@@ -1338,8 +1452,8 @@ class CompartmentalSystem(Statement):
         [0]
 
         """
-        inputs = [node.input for node in self._order_compartments()]
-        return Matrix(inputs)
+        inputs = [node.input._expr for node in self._order_compartments()]
+        return Matrix._from_symengine(symengine.Matrix(inputs))
 
     def __len__(self):
         """The number of compartments"""
@@ -1559,6 +1673,7 @@ class Bolus(Dose, Immutable):
             return NotImplemented
         return self._amount == other._amount and self._admid == other._admid
 
+    @cache_method
     def __hash__(self):
         return hash((self._amount, self._admid))
 
@@ -1661,12 +1776,16 @@ class Infusion(Dose, Immutable):
         >>> dose.free_symbols   # doctest: +SKIP
         {AMT, RATE}
         """
+        return set(self._free_symbols())
+
+    @cache_method
+    def _free_symbols(self) -> frozenset[Expr]:
         if self._rate is not None:
             symbs = self._rate.free_symbols
         else:
             assert self._duration is not None
             symbs = self._duration.free_symbols
-        return symbs | self._amount.free_symbols
+        return frozenset(symbs | self._amount.free_symbols)
 
     def subs(self, substitutions: Mapping[Expr, Expr]) -> Infusion:
         """Substitute expressions or symbols in dose
@@ -1703,6 +1822,7 @@ class Infusion(Dose, Immutable):
             and self._amount == other._amount
         )
 
+    @cache_method
     def __hash__(self):
         return hash((self._admid, self._rate, self._duration, self._amount))
 
@@ -1877,13 +1997,16 @@ class Compartment(CompartmentBase):
         >>> comp.free_symbols  # doctest: +SKIP
         {A_CENTRAL, ALAG, AMT}
         """
-        symbs = set()
-        for d in self.doses:
-            symbs |= d.free_symbols
-        symbs |= self.input.free_symbols
-        symbs |= self.lag_time.free_symbols
-        symbs |= self.bioavailability.free_symbols
-        return symbs
+        return set(self._free_symbols())
+
+    @cache_method
+    def _free_symbols(self) -> frozenset[Expr]:
+        return frozenset().union(
+            *(d.free_symbols for d in self._doses),
+            self._input.free_symbols,
+            self._lag_time.free_symbols,
+            self._bioavailability.free_symbols,
+        )
 
     def subs(self, substitutions: Mapping[Expr, Expr]) -> Compartment:
         """Substitute expressions or symbols in compartment
@@ -1896,6 +2019,9 @@ class Compartment(CompartmentBase):
         >>> comp.subs({"AMT": "DOSE"})
         Compartment(CENTRAL, amount=A_CENTRAL(t), doses=Bolus(DOSE, admid=1))
         """
+        return self._subs_prepared(_sympify_substitutions(substitutions))
+
+    def _subs_prepared(self, substitutions: dict) -> Compartment:
         if self.doses:
             new_doses = tuple()
             for d in self.doses:
@@ -1923,6 +2049,7 @@ class Compartment(CompartmentBase):
             and self._bioavailability == other._bioavailability
         )
 
+    @cache_method
     def __hash__(self):
         return hash(
             (
@@ -2001,6 +2128,10 @@ class Statements(Sequence, Immutable):
     """
 
     def __init__(self, statements: Union[Statements, Iterable[Statement]] = ()):
+        if isinstance(statements, Statements):
+            # Statements are immutable so the underlying tuple and all cached results can be shared
+            self.__dict__.update(statements.__dict__)
+            return
         if not isinstance(statements, tuple):
             statements = tuple(statements)
         self._statements = statements
@@ -2065,10 +2196,14 @@ class Statements(Sequence, Immutable):
         TAD, THETA(1), THETA(2), THETA(3), TIME, TVCL, TVV, V, W, WGT, Y, t}
 
         """
+        return set(self._free_symbols())
+
+    @cache_method
+    def _free_symbols(self) -> frozenset[Expr]:
         symbols = set()
         for assignment in self:
             symbols |= assignment.free_symbols
-        return symbols
+        return frozenset(symbols)
 
     @property
     def lhs_symbols(self) -> set[Expr]:
@@ -2081,14 +2216,11 @@ class Statements(Sequence, Immutable):
         >>> model.statements.lhs_symbols   # doctest: +SKIP
         {F, A_CENTRAL(t), TVV, CL, Y, VC, V, TVCL, S1}
         """
-        symbs = set()
-        for s in self:
-            if isinstance(s, Assignment):
-                symbs.add(s.symbol)
-            else:
-                assert isinstance(s, CompartmentalSystem)
-                symbs |= set(s.amounts)
-        return symbs
+        return set(self._lhs_symbols())
+
+    @cache_method
+    def _lhs_symbols(self) -> frozenset[Expr]:
+        return frozenset().union(*(s._defined_symbols() for s in self))
 
     @property
     def rhs_symbols(self) -> set[Expr]:
@@ -2106,6 +2238,7 @@ class Statements(Sequence, Immutable):
             symbs |= s.rhs_symbols
         return symbs
 
+    @cache_method
     def _get_ode_system_index(self):
         return next(
             map(
@@ -2138,6 +2271,7 @@ class Statements(Sequence, Immutable):
             return cs
 
     @property
+    @cache_method
     def before_odes(self) -> Statements:
         """All statements before the ODE system
 
@@ -2163,6 +2297,7 @@ class Statements(Sequence, Immutable):
         return self if i == -1 else self[:i]
 
     @property
+    @cache_method
     def after_odes(self) -> Statements:
         """All statements after the ODE system
 
@@ -2223,22 +2358,31 @@ class Statements(Sequence, Immutable):
                 V = VC
                 S₁ = VC
         """
-        return Statements(s.subs(substitutions) for s in self)
+        substitutions = _sympify_substitutions(substitutions)
+        return Statements(s._subs_prepared(substitutions) for s in self)
 
     def _lookup_last_assignment(
         self, symbol: TSymbol
     ) -> tuple[Optional[int], Optional[Assignment]]:
         if isinstance(symbol, str):
             symbol = Expr.symbol(symbol)
-        ind = None
-        assignment = None
-        for i, statement in enumerate(self):
-            if isinstance(statement, Assignment):
-                if statement.symbol == symbol:
-                    ind = i
-                    assignment = statement
+        else:
+            symbol = Expr(symbol)
+        ind = self._last_assignment_indices().get(symbol)
+        if ind is None:
+            return None, None
+        assignment = self[ind]
+        assert isinstance(assignment, Assignment)
         return ind, assignment
 
+    @cache_method
+    def _last_assignment_indices(self) -> dict[Expr, int]:
+        return {
+            statement.symbol: i
+            for i, statement in enumerate(self)
+            if isinstance(statement, Assignment)
+        }
+
     def find_assignment(self, symbol: TSymbol) -> Optional[Assignment]:
         """Returns last assignment of symbol
 
@@ -2343,33 +2487,47 @@ class Statements(Sequence, Immutable):
         symbol = Expr(symbol)
         expression = Expr(expression)
 
-        last = True
+        indices = self._assignment_indices()
+        if indices is None:
+            symb_indices = [
+                i for i, s in enumerate(self) if isinstance(s, Assignment) and s.symbol == symbol
+            ]
+        else:
+            symb_indices = indices.get(symbol, ())
+        if not symb_indices:
+            return self
+
         new = list(self._statements)
-        for i, stat in zip(range(len(new) - 1, -1, -1), reversed(new)):
-            if isinstance(stat, Assignment) and stat.symbol == symbol:
-                if last:
-                    new[i] = Assignment(symbol, expression)
-                    last = False
-                else:
-                    del new[i]
+        new[symb_indices[-1]] = Assignment(symbol, expression)
+        for i in reversed(symb_indices[:-1]):
+            del new[i]
         return Statements(new)
 
+    @cache_method
+    def _dependency_adjacency(self) -> tuple[tuple[int, ...], ...]:
+        # Indices of the statements that each statement directly depends on in descending order
+        definitions = {}  # Indices of all earlier statements defining each symbol or amount
+        adjacency = []
+        for i, statement in enumerate(self):
+            deps = set()
+            for symb in statement.rhs_symbols:
+                deps.update(definitions.get(symb, ()))
+            adjacency.append(tuple(sorted(deps, reverse=True)))
+            for symb in statement._defined_symbols():
+                definitions.setdefault(symb, []).append(i)
+        return tuple(adjacency)
+
+    @cache_method
     def _create_dependency_graph(self):
-        """Create a graph of dependencies between statements"""
+        """Create a graph of dependencies between statements
+
+        The graph is cached and frozen. Copy it before modifying.
+        """
+        adjacency = self._dependency_adjacency()
         graph = nx.DiGraph()
         for i in range(len(self) - 1, -1, -1):
-            rhs = self[i].rhs_symbols
-            for j in range(i - 1, -1, -1):
-                statement = self[j]
-                if isinstance(statement, Assignment):
-                    if statement.symbol in rhs:
-                        graph.add_edge(i, j)
-                else:
-                    assert isinstance(statement, CompartmentalSystem)
-                    amts = set(statement.amounts)
-                    if not rhs.isdisjoint(amts):
-                        graph.add_edge(i, j)
-        return graph
+            graph.add_edges_from((i, j) for j in adjacency[i])
+        return nx.freeze(graph)
 
     def direct_dependencies(self, statement: Statement) -> Statements:
         """Find all direct dependencies of a statement
@@ -2394,9 +2552,8 @@ class Statements(Sequence, Immutable):
         CL = TVCL⋅ℯ
         V = VC
         """
-        g = self._create_dependency_graph()
         index = self.index(statement)
-        succ = sorted(list(g.successors(index)))
+        succ = sorted(self._dependency_adjacency()[index])
         stats = Statements()
         stats._statements = [self[i] for i in succ]
         return stats
@@ -2426,29 +2583,27 @@ class Statements(Sequence, Immutable):
         else:
             symbol = Expr(symbol_or_statement)
             for i in range(len(self) - 1, -1, -1):
-                statement = self[i]
-                if (
-                    isinstance(statement, Assignment)
-                    and statement.symbol == symbol
-                    or isinstance(statement, CompartmentalSystem)
-                    and symbol in statement.amounts
-                ):
+                if symbol in self[i]._defined_symbols():
                     break
             else:
                 raise KeyError(f"Could not find symbol {symbol}")
-        g = self._create_dependency_graph()
         symbs = self[i].rhs_symbols
-        if i == 0 or not g:
-            # Special case for models with only one statement or no dependent statements
+        if i == 0 or symbs.isdisjoint(self._lhs_symbols()):
+            # Special case for the first statement or if nothing used is defined in self
             return symbs
-        for j, _ in nx.bfs_predecessors(g, i, sort_neighbors=lambda x: reversed(sorted(x))):
-            statement = self[j]
-            if isinstance(statement, Assignment):
-                symbs -= {statement.symbol}
-            else:
-                assert isinstance(statement, CompartmentalSystem)
-                symbs -= set(statement.amounts)
-            symbs |= statement.rhs_symbols
+        # Breadth first search visiting the dependencies of each statement in descending order
+        adjacency = self._dependency_adjacency()
+        visited = {i}
+        queue = deque((i,))
+        while queue:
+            for j in adjacency[queue.popleft()]:
+                if j in visited:
+                    continue
+                visited.add(j)
+                queue.append(j)
+                statement = self[j]
+                symbs -= statement._defined_symbols()
+                symbs |= statement.rhs_symbols
         return symbs
 
     def remove_symbol_definitions(
@@ -2468,29 +2623,33 @@ class Statements(Sequence, Immutable):
         statement : Statement
             Statement from which the symbols were removed
         """
-        graph = self._create_dependency_graph()
+        adjacency = self._dependency_adjacency()
         removed_ind = self._statements.index(statement)
         # Statements defining symbols and dependencies
-        candidates = set()
         symbols_set = set(symbols)
-        for i in range(removed_ind - 1, -1, -1):
-            stat = self[i]
-            if isinstance(stat, Assignment) and stat.symbol in symbols_set:
-                candidates.add(i)
-        for i in candidates.copy():
-            if i in graph:
-                candidates |= set(nx.dfs_preorder_nodes(graph, i))
+        candidates = {
+            i
+            for i in range(removed_ind)
+            if isinstance(self[i], Assignment) and self[i].symbol in symbols_set
+        }
+        if not candidates:
+            return self
+        candidates = _reachable_nodes(adjacency, candidates)
         # All statements needed for removed_ind
-        if removed_ind in graph:
-            keep = {down for _, down in nx.dfs_edges(graph, removed_ind)}
-        else:
-            keep = set()
+        keep = _reachable_nodes(adjacency, (removed_ind,))
+        keep.discard(removed_ind)
         candidates -= keep
         # Other dependencies after removed_ind
-        additional = {down for up, down in graph.edges if up > removed_ind and down in candidates}
-        for add in additional.copy():
-            additional |= set(nx.dfs_preorder_nodes(graph, add))
+        additional = {
+            down
+            for up in range(removed_ind + 1, len(self))
+            for down in adjacency[up]
+            if down in candidates
+        }
+        additional |= _reachable_nodes(adjacency, additional)
         remove = candidates - additional
+        if not remove:
+            return self
         return Statements(tuple(self[i] for i in range(len(self)) if i not in remove))
 
     def full_expression(self, expression: TExpr) -> Expr:
@@ -2514,14 +2673,72 @@ class Statements(Sequence, Immutable):
         POP_CL*WGT*exp(ETA_CL)
         """
         expression = Expr(expression)
-        for statement in reversed(self):
-            if isinstance(statement, CompartmentalSystem):
-                raise ValueError(
-                    "CompartmentalSystem not supported by full_expression. Use the properties before_odes "
-                    "or after_odes."
-                )
-            expression = expression.subs({statement.symbol: statement.expression})
-        return expression
+        if self._get_ode_system_index() != -1:
+            raise ValueError(
+                "CompartmentalSystem not supported by full_expression. Use the properties before_odes "
+                "or after_odes."
+            )
+        indices = self._assignment_indices()
+        if indices is None:
+            for statement in reversed(self):
+                expression = expression.subs({statement.symbol: statement.expression})
+            return expression
+
+        expansions = self._full_expressions()
+        expanded = expansions.get(expression)
+        if expanded is not None:
+            return expanded
+
+        # Only substitute the assignments that the expression transitively depends on
+        needed = set()
+        stack = [(expression.free_symbols, len(self))]
+        while stack:
+            symbs, end = stack.pop()
+            for symb in symbs:
+                symb_indices = indices.get(symb)
+                if symb_indices is None:
+                    continue
+                pos = bisect_left(symb_indices, end)
+                if pos == 0:
+                    continue
+                i = symb_indices[pos - 1]
+                if i not in needed:
+                    needed.add(i)
+                    stack.append((self[i].expression.free_symbols, i))
+
+        # Substitute in batches of statements that are independent of each other. This gives
+        # the same result as substituting one statement at a time in reverse order.
+        expanded = expression
+        batch, batch_symbols = {}, set()
+        for i in sorted(needed, reverse=True):
+            statement = self[i]
+            if statement.symbol in batch_symbols:
+                expanded = expanded.subs(batch)
+                batch, batch_symbols = {}, set()
+            batch[statement.symbol] = statement.expression
+            batch_symbols.add(statement.symbol)
+            batch_symbols.update(statement.expression.free_symbols)
+        if batch:
+            expanded = expanded.subs(batch)
+        expansions[expression] = expanded
+        return expanded
+
+    @cache_method
+    def _full_expressions(self) -> dict[Expr, Expr]:
+        # Memo of already expanded expressions. Statements are immutable so entries stay valid.
+        return {}
+
+    @cache_method
+    def _assignment_indices(self) -> Optional[dict[Expr, tuple[int, ...]]]:
+        # Indices of all assignments to each symbol. None if any assigned symbol is not a
+        # plain symbol since those cannot be found via free_symbols.
+        indices = {}
+        for i, statement in enumerate(self):
+            if isinstance(statement, Assignment):
+                if not isinstance(statement.symbol._expr, symengine.Symbol):
+                    return None
+                indices.setdefault(statement.symbol, []).append(i)
+        return {symb: tuple(inds) for symb, inds in indices.items()}
 
     def __eq__(self, other):
         if self is other:
@@ -2536,6 +2753,7 @@ class Statements(Sequence, Immutable):
                     return False
         return True
 
+    @cache_method
     def __hash__(self):
         return hash(self._statements)
 
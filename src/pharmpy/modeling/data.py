@@ -2112,7 +2112,10 @@ def create_default_datainfo(path_or_df):
 
 
 def deidentify_data(
-    df: pd.DataFrame, id_column: str = 'ID', date_columns: Optional[list[str]] = None
+    df: pd.DataFrame,
+    id_column: str = 'ID',
+    date_columns: Optional[list[str]] = None,
+    seed: Optional[Union[np.random.Generator, int]] = None,
 ):
     """Deidentify a dataset
 
@@ -2134,6 +2137,9 @@ def deidentify_data(
         Name of the id column
     date_columns : list
         Names of all date columns
+    seed : int or rng
+        Random number generator or seed for the randomization of ID numbers. Default is
+        None for a randomized seed.
 
     Returns
     -------
@@ -2142,7 +2148,7 @@ def deidentify_data(
     """
     df = df.copy()
     df[id_column] = pd.to_numeric(df[id_column])
-    resampler = resample_data(df, id_column)
+    resampler = resample_data(df, id_column, seed=seed)
     df, _ = next(resampler)
 
     if date_columns is None:
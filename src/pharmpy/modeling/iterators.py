@@ -20,6 +20,8 @@ from pharmpy.deps import pandas as pd
 from pharmpy.internals.math import round_and_keep_sum
 from pharmpy.model import Model
 
+from .parameter_sampling import create_rng
+
 
 class DatasetIterator:
     """Base class for iterator classes that generate new datasets from an input dataset
@@ -89,13 +91,21 @@ class Omit(DatasetIterator):
             raise ValueError("Cannot create an Omit iterator as the number of unique groups is 1.")
         self._df = df
         self._group = group
+        self._group_indices = df.groupby(group, sort=False).indices
+        # Mask of rows to keep. Only the rows of the previously and currently omitted
+        # groups need to be updated in each iteration.
+        self._keep = np.ones(len(df), dtype=bool)
+        self._previous_group = None
         super().__init__(len(self._unique_groups), name_pattern=name_pattern)
 
     def __next__(self):
         self._check_exhausted()
-        df = self._df
         next_group = self._unique_groups[self._next - 1]
-        new_df = df[df[self._group] != next_group]
+        if self._previous_group is not None:
+            self._keep[self._group_indices[self._previous_group]] = True
+        self._keep[self._group_indices[next_group]] = False
+        self._previous_group = next_group
+        new_df = self._df.take(np.flatnonzero(self._keep))
         self._prepare_next(new_df)
         return self._combine_dataset(new_df), next_group
 
@@ -146,6 +156,8 @@ class Resample(DatasetIterator):
         without replacement
     :param name_pattern: Name to use for generated datasets. A number starting from 1 will
         be put in the placeholder.
+    :param name: Name to use for the dataset in case of only one resample
+    :param seed: Random number generator or seed. Default is None for a randomized seed.
 
     :returns: A tuple of a resampled DataFrame and a list of resampled groups in order
     """
@@ -160,6 +172,7 @@ class Resample(DatasetIterator):
         replace=False,
         name_pattern='resample_{}',
         name=None,
+        seed=None,
     ):
         df = self._retrieve_dataset(dataset_or_model)
         unique_groups = df[group].unique()
@@ -205,9 +218,28 @@ class Resample(DatasetIterator):
 
         self._df = df
         self._group = group
+        # Groups are handled as integer codes into self._groups. The row positions of group
+        # with code i are self._group_rows[i]
+        codes, groups = pd.factorize(df[group], use_na_sentinel=False)
+        self._groups = np.asarray(groups)
+        self._group_sizes = np.bincount(codes, minlength=len(groups))
+        self._group_rows = np.split(
+            np.argsort(codes, kind='stable'), np.cumsum(self._group_sizes)[:-1]
+        )
         self._replace = replace
-        self._stratas = stratas
-        self._sample_size_dict = sample_size_dict
+        self._rng = create_rng(seed)
+        # Groups of all stratas stored contiguously. Groups of strata i are found in
+        # self._strata_groups[self._strata_offsets[i] : self._strata_offsets[i + 1]]
+        strata_order = list(sample_size_dict)
+        self._strata_groups = pd.Index(groups).get_indexer(
+            np.concatenate([np.asarray(stratas[strata]) for strata in strata_order])
+        )
+        self._strata_offsets = np.cumsum([0] + [len(stratas[strata]) for strata in strata_order])
+        self._strata_sample_sizes = np.array(
+            [sample_size_dict[strata] for strata in strata_order], dtype=np.int64
+        )
+        # The new group numbers are the same for all resamples
+        self._new_groups = np.arange(1, self._strata_sample_sizes.sum() + 1, dtype=np.int64)
         if resamples > 1 and name:
             warnings.warn(
                 f'One name was provided despite having multiple resamples, falling back to '
@@ -221,27 +253,30 @@ class Resample(DatasetIterator):
     def __next__(self):
         self._check_exhausted()
 
-        random_groups = []
-        for strata in self._sample_size_dict:
-            random_groups += np.random.choice(
-                self._stratas[strata],
-                size=self._sample_size_dict[strata],
-                replace=self._replace,
-            ).tolist()
-
-        new_df = pd.DataFrame()
-        # Build the dataset given the random_groups list
-        for grp_id, new_grp in zip(random_groups, range(1, len(random_groups) + 1)):
-            sub = self._df.loc[self._df[self._group] == grp_id].copy()
-            sub[self._group] = new_grp
-            new_df = pd.concat([new_df, sub])
+        random_codes = np.empty(self._strata_sample_sizes.sum(), dtype=np.intp)
+        start = 0
+        for i, size in enumerate(self._strata_sample_sizes):
+            codes = self._strata_groups[self._strata_offsets[i] : self._strata_offsets[i + 1]]
+            random_codes[start : start + size] = self._rng.choice(
+                codes, size=size, replace=self._replace
+            )
+            start += size
+
+        # Build the dataset given the random groups. The row positions of all
+        # groups are collected into one array so that the only copy is a single take.
+        sizes = self._group_sizes[random_codes]
+        rows = np.empty(sizes.sum(), dtype=np.intp)
+        if len(random_codes) > 0:
+            np.concatenate([self._group_rows[code] for code in random_codes.tolist()], out=rows)
+        new_df = self._df.take(rows)
+        new_df[self._group] = np.repeat(self._new_groups, sizes)
         new_df.reset_index(inplace=True, drop=True)
         if self._name:
             new_df.name = self._name
         else:
             self._prepare_next(new_df)
 
-        return self._combine_dataset(new_df), random_groups
+        return self._combine_dataset(new_df), self._groups[random_codes].tolist()
 
 
 def resample_data(
@@ -253,6 +288,7 @@ def resample_data(
     replace: bool = False,
     name_pattern: str = 'resample_{}',
     name: Optional[str] = None,
+    seed: Optional[Union[np.random.Generator, int]] = None,
 ):
     """Iterate over resamples of a dataset.
 
@@ -286,6 +322,8 @@ def resample_data(
         be put in the placeholder.
     name : str
         Option to name pattern in case of only one resample
+    seed : int or rng
+        Random number generator or seed. Default is None for a randomized seed.
 
     Returns
     -------
@@ -301,4 +339,5 @@ def resample_data(
         replace=replace,
         name_pattern=name_pattern,
         name=name,
+        seed=seed,
     )
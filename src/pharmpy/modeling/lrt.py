@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import islice
 from typing import Iterable, Union
 
 from pharmpy.deps import numpy as np
@@ -34,17 +36,18 @@ def degrees_of_freedom(
     return child_parameters - parent_parameters
 
 
+@lru_cache(maxsize=256)
+def _cutoff(df: int | float, alpha: float) -> float:
+    if df == 0:
+        return 0
+    elif df > 0:
+        return float(stats.chi2.isf(q=alpha, df=df))
+    else:
+        return -float(stats.chi2.isf(q=alpha, df=-df))
+
+
 def cutoff(parent: Model, child: Model, alpha: float) -> float:
-    df = degrees_of_freedom(parent, child)
-    return (
-        0
-        if df == 0
-        else (
-            float(stats.chi2.isf(q=alpha, df=df))
-            if df > 0
-            else -float(stats.chi2.isf(q=alpha, df=-df))
-        )
-    )
+    return _cutoff(degrees_of_freedom(parent, child), alpha)
 
 
 def p_value(reduced: Model, extended: Model, reduced_ofv, extended_ofv) -> float:
@@ -68,8 +71,10 @@ def best_of_many(
     # NOTE: numpy.nanargmin ignores NaN values and raises a ValueError when all
     # values are NaN.
     # See https://numpy.org/doc/stable/reference/generated/numpy.nanargmin.html
+    model_ofvs = np.asarray(model_ofvs, dtype=float)
     try:
         best_index = np.nanargmin(model_ofvs)
     except ValueError:
         return parent
-    return best_of_two(parent, list(models)[best_index], parent_ofv, model_ofvs[best_index], alpha)
+    best_model = next(islice(models, best_index, None))
+    return best_of_two(parent, best_model, parent_ofv, model_ofvs[best_index], alpha)
@@ -1678,14 +1678,12 @@ def _dose_zo(model, dose):
         else:
             value = dose.rate
         if isinstance(value, str) or isinstance(value, Expr) and value.is_symbol():
-            name = str(value)
-            if name not in model.datainfo.names:
-                return True
+            names = {str(value)}
         elif isinstance(value, Expr):
-            assert value is not None
             names = {symb.name for symb in value.free_symbols}
-            if not all(name in model.datainfo.names for name in names):
-                return True
+        else:
+            return False
+        return not names.issubset(model.datainfo.names)
     return False
 
 
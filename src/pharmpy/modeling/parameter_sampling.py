@@ -7,7 +7,11 @@ from typing import Literal, Optional, Union
 from pharmpy import DEFAULT_SEED
 from pharmpy.deps import numpy as np
 from pharmpy.deps import pandas as pd
-from pharmpy.internals.math import is_posdef, nearest_positive_semidefinite
+from pharmpy.internals.math import (
+    is_posdef,
+    nearest_positive_semidefinite,
+    positive_semidefinite_factors,
+)
 from pharmpy.model import Model
 
 
@@ -95,9 +99,12 @@ def _sample_from_function(
     lower = parameter_summary.lower.astype('float64').to_numpy()
     upper = parameter_summary.upper.astype('float64').to_numpy()
 
+    names = list(parameter_estimates.keys())
+    rvs = model.random_variables
+
     # reject non-posdef
-    kept_samples = pd.DataFrame()
-    remaining = n
+    kept_samples = np.empty((n, len(names)))
+    filled = 0
 
     if force_posdef_samples == 0:
         force_posdef = True
@@ -105,24 +112,22 @@ def _sample_from_function(
         force_posdef = False
 
     i = 0
-    while remaining > 0:
-        samples = samplingfn(pe, lower, upper, n=remaining, rng=rng)
-        df = pd.DataFrame(samples, columns=parameter_estimates.keys())
+    while filled < n:
+        samples = samplingfn(pe, lower, upper, n=n - filled, rng=rng)
         if not force_posdef:
-            selected = df[df.apply(model.random_variables.validate_parameters, axis=1)]
+            selected = samples[rvs.validate_parameter_samples(names, samples)]
         else:
-            rvs = model.random_variables
-            selected = df.transform(
-                lambda row: pd.Series(rvs.nearest_valid_parameters(row)), axis=1
-            )
-        assert isinstance(selected, pd.DataFrame)
-        kept_samples = pd.concat((kept_samples, selected))
-        remaining = n - len(kept_samples)
+            selected = np.empty_like(samples)
+            for j, row in enumerate(samples):
+                nearest = rvs.nearest_valid_parameters(dict(zip(names, row)))
+                selected[j] = [nearest[name] for name in names]
+        kept_samples[filled : filled + len(selected)] = selected
+        filled += len(selected)
         i += 1
         if not force_posdef and force_posdef_samples is not None and i >= force_posdef_samples:
             force_posdef = True
 
-    return kept_samples.reset_index(drop=True)
+    return pd.DataFrame(kept_samples, columns=names)
 
 
 def sample_parameters_uniformly(
@@ -323,17 +328,17 @@ def sample_individual_estimates(
     >>> sample_individual_estimates(model, ie, iec, samples_per_id=2, seed=rng)
                  ETA_CL    ETA_VC
     ID sample
-    1  0      -0.127941  0.037273
-       1      -0.065492 -0.182851
-    2  0      -0.263323 -0.265849
-       1      -0.295883 -0.060346
-    3  0      -0.012108  0.219967
+    1  0      -0.085400 -0.033502
+       1       0.321413 -0.049901
+    2  0       0.150942 -0.230390
+       1      -0.271956 -0.175603
+    3  0      -0.041096  0.103226
     ...             ...       ...
-    57 1      -0.034279 -0.040988
-    58 0      -0.187879 -0.143184
-       1      -0.088845 -0.034655
-    59 0      -0.187779 -0.014214
-       1      -0.019953 -0.151151
+    57 1       0.071922 -0.051506
+    58 0       0.106206 -0.238785
+       1      -0.143612 -0.137762
+    59 0      -0.196936 -0.129070
+       1       0.012216 -0.083825
     <BLANKLINE>
     [118 rows x 2 columns]
 
@@ -352,14 +357,12 @@ def sample_individual_estimates(
         parameters = list(ests.columns)
     ests = ests[parameters]
     assert isinstance(ests, pd.DataFrame)
-    samples = pd.DataFrame()
-    for (idx, mu), sigma in zip(ests.iterrows(), covs):
-        sigma = sigma.loc[parameters, parameters]
-        sigma = nearest_positive_semidefinite(sigma)
-        id_samples = rng.multivariate_normal(mu.to_numpy(), sigma.to_numpy(), size=samples_per_id)
-        id_df = pd.DataFrame(id_samples, columns=ests.columns)
-        id_df['ID'] = idx
-        id_df['sample'] = list(range(0, samples_per_id))
-        id_df.set_index(['ID', 'sample'], drop=True, inplace=True)
-        samples = pd.concat((samples, id_df))
+    # Draw the samples for all individuals at once
+    mu = ests.to_numpy()
+    sigmas = np.stack([sigma.loc[parameters, parameters].to_numpy() for sigma in covs])
+    factors = positive_semidefinite_factors(sigmas)
+    z = rng.standard_normal((len(mu), samples_per_id, len(parameters)))
+    values = mu[:, np.newaxis, :] + z @ factors.transpose(0, 2, 1)
+    index = pd.MultiIndex.from_product([ests.index, range(samples_per_id)], names=['ID', 'sample'])
+    samples = pd.DataFrame(values.reshape(-1, len(parameters)), index=index, columns=ests.columns)
     return samples
@@ -111,8 +111,10 @@ def summarize_tool(
     index = pd.Index(rows.keys(), name='model')
     df_descr = pd.DataFrame(rows.values(), index=index, columns=colnames)
 
-    df = pd.concat([df_descr, df_rank], axis=1)
-    df['parent_model'] = df.pop('parent_model')
+    # parent_model is placed last
+    df = pd.concat(
+        [df_descr.drop(columns='parent_model'), df_rank, df_descr['parent_model']], axis=1
+    )
 
     df_sorted = df.reindex(df_rank.index)
 
@@ -5,13 +5,15 @@ import subprocess
 import sys
 import uuid
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 import pharmpy.config as config
 import pharmpy.model
+from pharmpy.basic import Matrix
+from pharmpy.deps import numpy as np
 from pharmpy.deps import pandas as pd
-from pharmpy.internals.code_generator import CodeGenerator
 from pharmpy.model.external.nlmixr import convert_model
 from pharmpy.model.external.nlmixr.model import add_evid
 from pharmpy.modeling import (
@@ -23,13 +25,23 @@ from pharmpy.modeling import (
     set_initial_estimates,
     write_csv,
 )
-from pharmpy.tools import fit
 from pharmpy.workflows import ModelEntry, default_context
 from pharmpy.workflows.log import Log
 from pharmpy.workflows.results import ModelfitResults
 
 PARENT_DIR = f'..{os.path.sep}'
 
+_SAVE_RESULTS_TEMPLATE = (
+    'ofv <- fit$objDf$OBJF\n'
+    'thetas <- as.data.frame(fit$theta)\n'
+    'omega <- fit$omega\n'
+    'sigma <- as.data.frame(fit$theta)\n'
+    'log_likelihood <- fit$objDf$`Log-likelihood`\n'
+    'runtime_total <- sum(fit$time)\n'
+    'pred <- as.data.frame(fit[c("PRED", "IPRED")])\n'
+    'save(file="{rdata_path}",ofv, thetas, omega, sigma, log_likelihood, runtime_total, pred)'
+)
+
 
 def execute_model(model_entry, context, evaluate=False, path=None):
     assert isinstance(model_entry, ModelEntry)
@@ -69,28 +81,19 @@ def execute_model(model_entry, context, evaluate=False, path=None):
         pre += f'etas <- as.matrix(read.csv("{fix_eta_path}"))'
     pre += "\n"
 
-    code = pre + model.code
-    cg = CodeGenerator()
-    cg.add('ofv <- fit$objDf$OBJF')
-    cg.add('thetas <- as.data.frame(fit$theta)')
-    cg.add('omega <- fit$omega')
-    cg.add('sigma <- as.data.frame(fit$theta)')
-    cg.add('log_likelihood <- fit$objDf$`Log-likelihood`')
-    cg.add('runtime_total <- sum(fit$time)')
-    cg.add('pred <- as.data.frame(fit[c("PRED", "IPRED")])')
-
     if sys.platform == 'win32':
         p = f"{path / model.name}.RDATA".replace("\\", "\\\\")
     else:
         p = f"{path / model.name}.RDATA"
-    cg.add(f'save(file="{p}",ofv, thetas, omega, sigma, log_likelihood, runtime_total, pred)')
-    code += f'\n{str(cg)}'
     with open(path / f'{model.name}.R', 'w') as fh:
-        fh.write(code)
+        fh.write(pre)
+        fh.write(model.code)
+        fh.write('\n')
+        fh.write(_SAVE_RESULTS_TEMPLATE.format(rdata_path=p))
 
     rpath = get_rpath()
 
-    newenv = os.environ
+    newenv = os.environ.copy()
     # Reset environment variables incase started from R
     # and calling other R version.
     newenv['R_LIBS_USERS'] = ''
@@ -224,6 +227,8 @@ def verification(
 
     """
 
+    from pharmpy.tools import fit
+
     nonmem_model = model
 
     try:
@@ -335,137 +340,77 @@ def compare_models(
     if "EVID" not in mod2.dataset.columns:
         mod2 = add_evid(mod2)
 
+    dv_var = "DV"
     if nm_to_r:
         if mod1_type == "nonmem":
+            dataset = mod1.dataset
+            observations = dataset["EVID"].isin([0, 2]).to_numpy()
             predictions = model_1_res.predictions.reset_index()
-            predictions = predictions.drop(
-                mod1.dataset[~mod1.dataset["EVID"].isin([0, 2])].index.to_list()
-            )
-            mod1_res_pred = ModelfitResults(predictions=predictions)
+            mod1_res_pred = ModelfitResults(predictions=predictions.loc[observations])
             mod2_res_pred = model_2_res
 
-            dataset = mod1.dataset
-            dv_var = "DV"
-            dv = dataset.drop(mod1.dataset[~mod1.dataset["EVID"].isin([0, 2])].index.to_list())[
-                dv_var
-            ]
+            dv = dataset.loc[observations, dv_var]
         if mod2_type == "nonmem":
+            dataset = mod2.dataset
+            observations = dataset["EVID"].isin([0, 2]).to_numpy()
             predictions = model_2_res.predictions.reset_index()
-            predictions = predictions.drop(
-                mod2.dataset[~mod2.dataset["EVID"].isin([0, 2])].index.to_list()
-            )
-
             mod1_res_pred = model_1_res
-            mod2_res_pred = ModelfitResults(predictions=predictions)
+            mod2_res_pred = ModelfitResults(predictions=predictions.loc[observations])
 
-            dataset = mod2.dataset
-            dv_var = "DV"
-            dv = dataset.drop(mod2.dataset[~mod2.dataset["EVID"].isin([0, 2])].index.to_list())[
-                dv_var
-            ]
+            dv = dataset.loc[observations, dv_var]
     else:
         dataset = mod1.dataset
-        dv_var = "DV"
-        dv = dataset.drop(mod1.dataset[~mod1.dataset["EVID"].isin([0, 2])].index.to_list())[dv_var]
+        dv = dataset.loc[dataset["EVID"].isin([0, 2]).to_numpy(), dv_var]
 
     dv = dv.reset_index(drop=True)
 
-    mod1_results = mod1_res_pred.predictions.copy()
-
-    mod2_results = mod2_res_pred.predictions.copy()
+    mod1_results = mod1_res_pred.predictions
+    mod2_results = mod2_res_pred.predictions
 
-    pred = False
-    ipred = False
-    # ---
     if force_pred:
-        if "PRED" in mod1_results.columns:
-            pred = True
-            p = "PRED"
-            assert p in mod2_results.columns
-            mod1_results.rename(columns={p: f'PRED_{mod1_type}'}, inplace=True)
-            mod2_results.rename(columns={p: f'PRED_{mod2_type}'}, inplace=True)
-        else:
+        candidates = ("PRED",)
+    elif force_ipred:
+        candidates = ("IPRED", "CIPREDI")
+    else:
+        candidates = ("PRED", "IPRED", "CIPREDI")
+    p = next((c for c in candidates if c in mod1_results.columns), None)
+    if p is None:
+        if force_pred:
             print("No PRED column found")
             return None
-    elif force_ipred:
-        if "IPRED" in mod1_results.columns:
-            p = "IPRED"
-            ipred = True
-            assert p in mod2_results.columns
-            mod1_results.rename(columns={p: f'{p}_{mod1_type}'}, inplace=True)
-            mod2_results.rename(columns={p: f'IPRED_{mod2_type}'}, inplace=True)
-        elif "CIPREDI" in mod1_results.columns:
-            p = "CIPREDI"
-            ipred = True
-            assert p in mod2_results.columns
-            mod1_results.rename(columns={p: f'{p}_{mod1_type}'}, inplace=True)
-            mod2_results.rename(columns={p: f'IPRED_{mod2_type}'}, inplace=True)
-        else:
+        elif force_ipred:
             print("No IPRED (or CIPRED) column found")
             return None
-    else:
-        if "PRED" in mod1_results.columns:
-            p = "PRED"
-            pred = True
-            assert p in mod2_results.columns
-            mod1_results.rename(columns={p: f'PRED_{mod1_type}'}, inplace=True)
-            mod2_results.rename(columns={p: f'PRED_{mod2_type}'}, inplace=True)
-        elif "IPRED" in mod1_results.columns:
-            p = "IPRED"
-            ipred = True
-            mod1_results.rename(columns={p: f'{p}_{mod1_type}'}, inplace=True)
-            assert p in mod2_results.columns
-            mod2_results.rename(columns={p: f'{p}_{mod2_type}'}, inplace=True)
-        elif "CIPREDI" in mod1_results.columns:
-            p = "CIPREDI"
-            ipred = True
-            mod1_results.rename(columns={p: f'IPRED_{mod1_type}'}, inplace=True)
-            if p not in mod2_results.columns:
-                mod2_results.rename(columns={"IPRED": f'IPRED_{mod2_type}'}, inplace=True)
-            else:
-                mod2_results.rename(columns={p: f'IPRED_{mod2_type}'}, inplace=True)
-
-    if not (pred or ipred):
         print("No comparable prediction value was found. Please use 'PRED' or 'IPRED")
         return False
 
-    combined_result = mod1_results
-    if pred:
-        combined_result[f'PRED_{mod2_type}'] = mod2_results[f'PRED_{mod2_type}'].to_list()
-        # Add difference between the models
-        combined_result['PRED_DIFF'] = abs(
-            combined_result[f'PRED_{mod1_type}'] - combined_result[f'PRED_{mod2_type}']
-        )
-    if ipred:
-        combined_result[f'IPRED_{mod2_type}'] = mod2_results[f'IPRED_{mod2_type}'].to_list()
-        combined_result['IPRED_DIFF'] = abs(
-            combined_result[f'IPRED_{mod1_type}'] - combined_result[f'IPRED_{mod2_type}']
-        )
+    # CIPREDI is compared with IPRED if the other model does not have it
+    final = "PRED" if p == "PRED" else "IPRED"
+    p2 = p if p in mod2_results.columns else final
+    assert p2 in mod2_results.columns
+    col1, col2 = f'{final}_{mod1_type}', f'{final}_{mod2_type}'
+
+    combined_result = mod1_results.rename(columns={p: col1})
+    combined_result[col2] = mod2_results[p2].to_numpy()
+    # Add difference between the models
+    combined_result[f'{final}_DIFF'] = np.abs(
+        combined_result[col1].to_numpy() - combined_result[col2].to_numpy()
+    )
 
     combined_result["DV"] = dv.values
 
-    combined_result["PASS/FAIL"] = "PASS"
     if not ignore_print:
         print("Differences in population predicted values")
-    if (pred and ipred) or (pred and not ipred):
-        if force_ipred:
-            if not ignore_print:
-                print("Using IPRED values for final comparison")
-            final = "IPRED"
-        else:
-            if not ignore_print:
-                print("Using PRED values for final comparison")
-            final = "PRED"
-    elif ipred and not pred:
-        if force_ipred:
-            if not ignore_print:
-                print("Using IPRED values for final comparison")
+        if final == "PRED":
+            print("Using PRED values for final comparison")
+        elif force_ipred:
+            print("Using IPRED values for final comparison")
         else:
-            if not ignore_print:
-                print("Using IPRED values instead")
-        final = "IPRED"
+            print("Using IPRED values instead")
 
-    combined_result.loc[combined_result[f'{final}_DIFF'] > error, "PASS/FAIL"] = "FAIL"
+    combined_result["PASS/FAIL"] = np.where(
+        combined_result[f'{final}_DIFF'].to_numpy() > error, "FAIL", "PASS"
+    )
     if not ignore_print:
         print(
             combined_result[f'{final}_DIFF'].describe()[["min", "mean", "75%", "max"]].to_string(),
@@ -554,7 +499,12 @@ def write_fix_eta(modelfit_results: ModelfitResults, path=None, force=True) -> s
         raise FileExistsError(f'File at {path} already exists.')
 
     path = path_absolute(path)
-    modelfit_results.individual_estimates.to_csv(path, na_rep=conf.missing_data_token, index=False)
+    ie = modelfit_results.individual_estimates
+    values = ie.to_numpy()
+    if values.dtype.kind in 'iuf' and not np.isnan(values).any():
+        np.savetxt(path, values, fmt='%s', delimiter=',', header=','.join(ie.columns), comments='')
+    else:
+        ie.to_csv(path, na_rep=conf.missing_data_token, index=False)
     return path
 
 
@@ -594,6 +544,15 @@ def verify_param(model1, res1, model2, res2, est=False):
     return passed, failed
 
 
+@lru_cache(maxsize=1)
+def _pyreadr():
+    with warnings.catch_warnings():
+        # Supress a numpy deprecation warning
+        warnings.simplefilter("ignore")
+        import pyreadr
+    return pyreadr
+
+
 def parse_modelfit_results(model: pharmpy.model.Model, path: Path) -> Union[None, ModelfitResults]:
     """
     Create ModelfitResults object for given model object taken from values saved in executed Rdata file
@@ -612,10 +571,7 @@ def parse_modelfit_results(model: pharmpy.model.Model, path: Path) -> Union[None
 
     """
     rdata_path = path / (model.name + '.RDATA')
-    with warnings.catch_warnings():
-        # Supress a numpy deprecation warning
-        warnings.simplefilter("ignore")
-        import pyreadr
+    pyreadr = _pyreadr()
     try:
         rdata = pyreadr.read_r(rdata_path)
     except (FileNotFoundError, OSError, pyreadr.PyreadrError):
@@ -629,33 +585,35 @@ def parse_modelfit_results(model: pharmpy.model.Model, path: Path) -> Union[None
     rdata["sigma"] = rdata["sigma"].loc[s]
 
     ofv = rdata['ofv']['ofv'][0]
-    omegas_sigmas = {}
-    omega = model.random_variables.etas.covariance_matrix
-    for i in range(0, omega.rows):
-        for j in range(0, omega.cols):
-            symb = omega[i, j]
-            if symb != 0:
-                omegas_sigmas[symb.name] = rdata['omega'].values[i, j]
+    # Only visit the blocks of omega, the rest of the matrix is known to be zero
+    omega_names, rows, cols = [], [], []
+    offset = 0
+    for dist in model.random_variables.etas:
+        n = len(dist)
+        variance = dist.variance if n > 1 else Matrix([[dist.variance]])
+        for i in range(n):
+            for j in range(n):
+                symb = variance[i, j]
+                if symb != 0:
+                    omega_names.append(symb.name)
+                    rows.append(offset + i)
+                    cols.append(offset + j)
+        offset += n
+    omega_values = rdata['omega'].to_numpy()[rows, cols]
+    omegas_sigmas = dict(zip(omega_names, omega_values))
     sigma = model.random_variables.epsilons.covariance_matrix
-    for i in range(len(sigma)):
-        if sigma[i] != 0:
-            s = sigma[i]
-            if model.parameters[s].init != 1 and not model.parameters[s].fix:
-                omegas_sigmas[sigma[i].name] = rdata['sigma']['fit$theta'][sigma[i].name]
-    thetas_index = 0
-    pe = {}
-    for param in model.parameters:
-        if param.fix:
-            continue
-        elif param.name in omegas_sigmas:
-            pe[param.name] = omegas_sigmas[param.name]
-        else:
-            pe[param.name] = rdata['thetas']['fit$theta'][param.name]
-            thetas_index += 1
-
-    pe = pd.Series(pe)
+    for symb in sigma:
+        if symb != 0:
+            param = model.parameters[symb]
+            if param.init != 1 and not param.fix:
+                omegas_sigmas[symb.name] = rdata['sigma']['fit$theta'][symb.name]
+    estimates = rdata['thetas']['fit$theta'].to_dict()
+    estimates.update(omegas_sigmas)
+    names = model.parameters.nonfixed.names
+    pe = pd.Series([estimates[name] for name in names], index=names)
     predictions = rdata['pred']
-    predictions = predictions.set_index(model.dataset[model.dataset["DV"] != 0].index)
+    dataset = model.dataset
+    predictions.index = dataset.index[dataset["DV"].to_numpy() != 0]
 
     res = ModelfitResults(
         ofv=ofv,
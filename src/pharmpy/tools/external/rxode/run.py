@@ -66,7 +66,7 @@ def execute_model(model_entry, db):
 
     rpath = conf.rpath / 'bin' / 'Rscript'
 
-    newenv = os.environ
+    newenv = os.environ.copy()
     # Reset environment variables incase started from R
     # and calling other R version.
     newenv['R_LIBS_USERS'] = ''
@@ -688,18 +688,17 @@ def calculate_results_from_samples(
                     )
 
         id_mu = np.array([0] * npars + list(cov_refs))
+        assert npars + covbase.shape[1] == len(id_mu)
         cjn = conditional_joint_normal_lambda(id_mu, sigma, npars)
-        for i in range(len(estimated_covbase)):
-            row = covbase[i, :]
-            assert npars + len(row) == len(id_mu)
-            mu_id_bar, sigma_id_bar = cjn(row)
-            if sample_no != 'estimates':
-                mu_id_bars[sample_no, i, :] = mu_id_bar
-                variability[sample_no, -1, :] = np.diag(sigma_id_bar)
-            else:
-                original_id_bar[i, :] = mu_id_bar
-                original_variability[ncovs + 1, :] = np.diag(sigma_id_bar)
-                parameter_variability_all = sigma_id_bar
+        # NOTE: Condition on the covariates of all individuals at once
+        mu_id_bar, sigma_id_bar = cjn(covbase)
+        if sample_no != 'estimates':
+            mu_id_bars[sample_no, : len(covbase), :] = mu_id_bar
+            variability[sample_no, -1, :] = np.diag(sigma_id_bar)
+        else:
+            original_id_bar[: len(covbase), :] = mu_id_bar
+            original_variability[ncovs + 1, :] = np.diag(sigma_id_bar)
+            parameter_variability_all = sigma_id_bar
 
     # Create covariate effects table
     mu_bars_given_5th = np.exp(mu_bars_given_5th)
@@ -707,10 +706,9 @@ def calculate_results_from_samples(
 
     means_5th = np.mean(mu_bars_given_5th, axis=0)
     means_95th = np.mean(mu_bars_given_95th, axis=0)
-    q5_5th = np.quantile(mu_bars_given_5th, 0.05, axis=0)
-    q5_95th = np.quantile(mu_bars_given_95th, 0.05, axis=0)
-    q95_5th = np.quantile(mu_bars_given_5th, 0.95, axis=0)
-    q95_95th = np.quantile(mu_bars_given_95th, 0.95, axis=0)
+    # NOTE: Both quantiles from one call to only partition each array once
+    q5_5th, q95_5th = np.quantile(mu_bars_given_5th, [0.05, 0.95], axis=0)
+    q5_95th, q95_95th = np.quantile(mu_bars_given_95th, [0.05, 0.95], axis=0)
 
     param_col = []
     cov_col = []
@@ -764,8 +762,7 @@ def calculate_results_from_samples(
         warnings.filterwarnings("ignore", category=DeprecationWarning)
         with np.testing.suppress_warnings() as sup:  # Would warn in case of missing covariates
             sup.filter(RuntimeWarning, "All-NaN slice encountered")
-            id_5th = np.nanquantile(mu_id_bars, 0.05, axis=0)
-            id_95th = np.nanquantile(mu_id_bars, 0.95, axis=0)
+            id_5th, id_95th = np.nanquantile(mu_id_bars, [0.05, 0.95], axis=0)
 
     param_col = []
     obs_col = []
@@ -786,8 +783,7 @@ def calculate_results_from_samples(
     individual_effects = df
 
     # Create unexplained variability table
-    sd_5th = np.sqrt(np.nanquantile(variability, 0.05, axis=0))
-    sd_95th = np.sqrt(np.nanquantile(variability, 0.95, axis=0))
+    sd_5th, sd_95th = np.sqrt(np.nanquantile(variability, [0.05, 0.95], axis=0))
     original_sd = np.sqrt(original_variability)
 
     param_col = []
@@ -939,14 +935,17 @@ def calculate_results_using_bipp(
         )
         pop_params = np.array(dist.variance).astype(str)[lower_indices]
     parameter_samples = np.empty((samples, len(pop_params)))
+    # NOTE: Draws the same rows as pool.sample(n=ninds, replace=True, random_state=...) would
+    random_state = np.random.RandomState(rng.bit_generator)
+    pool_values = pool.to_numpy()
+    ishr_values = ishr.loc[pool.index].to_numpy()
     remaining_samples = samples
     k = 0
     while k < remaining_samples:
-        bootstrap = pool.sample(n=ninds, replace=True, random_state=rng.bit_generator)
-        ishk = ishr.loc[bootstrap.index]
-        mean = ishk.to_numpy().mean(0)
+        rows = random_state.choice(len(pool_values), size=ninds, replace=True)
+        mean = ishr_values[rows].mean(0)
         cf = (1 / (1 - mean)) ** (1 / 2)
-        corrected_bootstrap = np.multiply(bootstrap.to_numpy(), cf)
+        corrected_bootstrap = np.multiply(pool_values[rows], cf)
         bootstrap_cov = np.cov(np.transpose(corrected_bootstrap))
         if not is_posdef(bootstrap_cov):
             continue
@@ -28,9 +28,10 @@ from pharmpy.tools.common import (
 )
 from pharmpy.tools.modelfit import create_fit_workflow
 from pharmpy.tools.run import (
+    concat_model_summaries,
+    get_model_entry_summary,
     run_subtool,
     summarize_errors_from_entries,
-    summarize_modelfit_results_from_entries,
 )
 from pharmpy.workflows import ModelEntry, Task, Workflow, WorkflowBuilder
 from pharmpy.workflows.results import ModelfitResults
@@ -434,14 +435,18 @@ def create_summary_tool(context):
 
 
 def create_results_tables(step_mapping, model_dict):
+    # Summarize each model once also if it is part of more than one step
+    model_summaries = {
+        model_name: get_model_entry_summary(model_entry)
+        for model_name, model_entry in model_dict.items()
+        if model_entry is not None and model_entry.modelfit_results is not None
+    }
     sum_mod = []
     for step, model_names in step_mapping.items():
-        candidate_entries = [
-            model_entry
-            for model_name, model_entry in model_dict.items()
-            if model_name in model_names
+        summaries = [
+            summary for model_name, summary in model_summaries.items() if model_name in model_names
         ]
-        sum_mod_step = summarize_modelfit_results_from_entries(candidate_entries)
+        sum_mod_step = concat_model_summaries(summaries)
         sum_mod.append(sum_mod_step)
 
     keys = list(range(0, len(step_mapping)))
@@ -14,6 +14,8 @@ from ..statement.feature.symbols import Wildcard
 from ..statement.statement import Statement
 from .feature import Feature
 
+_IS_PRODUCTION = {'PRODUCTION': True, 'DEGRADATION': False}
+
 
 def features(model: Model, statements: Iterable[Statement]) -> Iterable[Feature]:
     for statement in statements:
@@ -29,15 +31,9 @@ def features(model: Model, statements: Iterable[Statement]) -> Iterable[Feature]
                 else statement.production
             )
 
-            params = list(product(modes, production))
-            params = [(mode.name, production.name) for mode, production in params]
-
-            for param in params:
-                if param[1] == 'PRODUCTION':
-                    yield ('INDIRECT', *param), partial(
-                        add_indirect_effect, expr=param[0].lower(), prod=True
-                    )
-                elif param[1] == 'DEGRADATION':
-                    yield ('INDIRECT', *param), partial(
-                        add_indirect_effect, expr=param[0].lower(), prod=False
+            for mode, prod in product(modes, production):
+                is_production = _IS_PRODUCTION.get(prod.name)
+                if is_production is not None:
+                    yield ('INDIRECT', mode.name, prod.name), partial(
+                        add_indirect_effect, expr=mode.name.lower(), prod=is_production
                     )
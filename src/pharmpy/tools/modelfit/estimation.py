@@ -25,32 +25,24 @@ class EstimationState:
 
 
 def build_matrix_gradients(coords):
-    # Build dA/dx for each matrix parameter x
-    n = coords[-1][0] + 1
-    grads = []
-    for row, col in coords:
-        D = np.zeros((n, n))
-        D[row, col] = 1.0
-        grads.append(D)
-    return grads
+    # dA/dx for each matrix parameter x has a single one at (row, col)
+    return [(row, col) for row, col in coords]
 
 
-def build_zero_gradients(coords, n):
-    size = coords[-1][0] + 1
-    A = np.zeros((size, size))
-    zeros = [A] * n
-    return zeros
+def build_zero_gradients(n):
+    # None for parameters that A does not depend on
+    return [None] * n
 
 
 def build_parameter_symbolic_gradients(nthetas, omega_coords, sigma_coords):
     omegas = (
-        build_zero_gradients(omega_coords, nthetas)
+        build_zero_gradients(nthetas)
         + build_matrix_gradients(omega_coords)
-        + build_zero_gradients(omega_coords, len(sigma_coords))
+        + build_zero_gradients(len(sigma_coords))
+    )
+    sigmas = build_zero_gradients(nthetas + len(omega_coords)) + build_matrix_gradients(
+        sigma_coords
     )
-    sigmas = build_zero_gradients(
-        sigma_coords, nthetas + len(omega_coords)
-    ) + build_matrix_gradients(sigma_coords)
     return omegas, sigmas
 
 
@@ -67,17 +59,15 @@ def init(model):
 
     parameter_symbols = get_parameter_symbols(model)
 
-    symbolic_dG_dx_all = [
-        [eta.diff(param) for eta in symbolic_eta_gradient] for param in parameter_symbols
-    ]
-    symbolic_dH_dx_all = [
-        [eps.diff(param) for eps in symbolic_eps_gradient] for param in parameter_symbols
-    ]
-
     df = model.dataset
     dvcol = model.datainfo.dv_column.name
     idcol = model.datainfo.id_column.name
-    ids = df[idcol].unique()
+    # DV values grouped by individual in order of appearance. The observations of
+    # individual k are dv[starts[k]:starts[k] + counts[k]]
+    codes, _ = pd.factorize(df[idcol])
+    dv = df[dvcol].to_numpy()[np.argsort(codes, kind='stable')]
+    counts = np.bincount(codes)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
 
     omega_inits = build_initial_values_matrix(model.random_variables.etas, model.parameters)
     sigma_inits = build_initial_values_matrix(model.random_variables.epsilons, model.parameters)
@@ -87,6 +77,20 @@ def init(model):
     sigma_coords = build_parameter_coordinates(sigma_inits)
 
     theta_scale = scale_thetas(get_thetas(model))
+    # Compile all expressions into one function writing into a preallocated array.
+    # They only depend on the thetas. See _split_values for the layout.
+    theta_symbols = parameter_symbols[: len(theta_scale[0])]
+    exprs = (
+        symbolic_eta_gradient
+        + symbolic_eps_gradient
+        + [y_norvs]
+        + [eta.diff(param) for param in parameter_symbols for eta in symbolic_eta_gradient]
+        + [eps.diff(param) for param in parameter_symbols for eps in symbolic_eps_gradient]
+        + [y_norvs.diff(param) for param in parameter_symbols]
+    )
+    exprs_func = symengine.Lambdify(theta_symbols, exprs, cse=True)
+    values = np.empty(len(exprs))
+    sizes = (len(symbolic_eta_gradient), len(symbolic_eps_gradient), len(parameter_symbols))
     omega_grads, sigma_grads = build_parameter_symbolic_gradients(
         len(theta_scale[0]), omega_coords, sigma_coords
     )
@@ -102,16 +106,12 @@ def init(model):
         sigma_scale,
         omega_coords,
         sigma_coords,
-        symbolic_eta_gradient,
-        symbolic_eps_gradient,
-        y_norvs,
-        parameter_symbols,
-        ids,
-        df,
-        idcol,
-        dvcol,
-        symbolic_dG_dx_all,
-        symbolic_dH_dx_all,
+        exprs_func,
+        values,
+        sizes,
+        dv,
+        counts,
+        starts,
         omega_grads,
         sigma_grads,
         state,
@@ -119,22 +119,32 @@ def init(model):
     return x, func, state
 
 
+def _split_values(values, neta, neps, nparams):
+    # Views of the evaluated expressions in the order they were compiled in init
+    ends = np.cumsum([neta, neps, 1, nparams * neta, nparams * neps])
+    eta_gradient, eps_gradient, pred, dG_dx_all, dH_dx_all, dP_dx_all = np.split(values, ends)
+    return (
+        eta_gradient,
+        eps_gradient,
+        pred[0],
+        dG_dx_all.reshape(nparams, neta),
+        dH_dx_all.reshape(nparams, neps),
+        dP_dx_all,
+    )
+
+
 def ofv_func(
     theta_scale,
     omega_scale,
     sigma_scale,
     omega_coords,
     sigma_coords,
-    symbolic_eta_gradient,
-    symbolic_eps_gradient,
-    y_norvs,
-    parameter_symbols,
-    ids,
-    df,
-    idcol,
-    dvcol,
-    symbolic_dG_dx_all,
-    symbolic_dH_dx_all,
+    exprs_func,
+    values,
+    sizes,
+    dv,
+    counts,
+    starts,
     omega_grads,
     sigma_grads,
     state,
@@ -151,58 +161,50 @@ def ofv_func(
     state.omega = omega
     state.sigma = sigma
 
-    print(theta, omega, sigma)
-
-    theta_subs = {parameter_symbols[i]: value for i, value in enumerate(theta)}
-    subs_eta_gradient = [deta.subs(theta_subs) for deta in symbolic_eta_gradient]
-    subs_eps_gradient = [deps.subs(theta_subs) for deps in symbolic_eps_gradient]
-    subs_y_norvs = y_norvs.subs(theta_subs)
-
-    OFVsum = 0.0
-    gradsum = [0.0] * len(x)
-
-    for curid in ids:
-        curdf = df[df[idcol] == curid]
-        DVi = np.array(curdf[dvcol])
-        Gi = np.array([[float(val) for val in subs_eta_gradient]] * len(DVi))
-        Hi = np.array([[float(val) for val in subs_eps_gradient]] * len(DVi))
-        PREDi = np.array([float(subs_y_norvs)] * len(DVi))
-        RESi = DVi - PREDi
-        Ci = Gi @ omega @ Gi.T + (Hi @ sigma @ Hi.T) * np.eye(len(DVi))
-        try:
-            Ci_inv = np.linalg.inv(Ci)
-        except np.linalg.LinAlgError:
-            return np.inf, np.zeros_like(x)
-        OFVi = np.log(np.linalg.det(Ci)) + RESi.T @ Ci_inv @ RESi
-        OFVsum += OFVi
-
-        # gradient calculation
-        for i, param in enumerate(parameter_symbols):
-            symbolic_dG_dx = symbolic_dG_dx_all[i]
-            symbolic_dH_dx = symbolic_dH_dx_all[i]
-            symbolic_dP_dx = y_norvs.diff(param)
-            symbolic_dG_dx_subs = [e.subs(theta_subs) for e in symbolic_dG_dx]
-            symbolic_dH_dx_subs = [e.subs(theta_subs) for e in symbolic_dH_dx]
-            symbolic_dP_dx_subs = symbolic_dP_dx.subs(theta_subs)
-            dGi = np.array([[float(val) for val in symbolic_dG_dx_subs]] * len(DVi))
-            dHi = np.array([[float(val) for val in symbolic_dH_dx_subs]] * len(DVi))
-            neg_dPi = -np.array([float(symbolic_dP_dx_subs)] * len(DVi))
-            symb_omega = omega_grads[i]
-            symb_sigma = sigma_grads[i]
-            dCi = (
-                dGi @ omega @ Gi.T
-                + Gi @ symb_omega @ Gi.T
-                + Gi @ omega @ dGi.T
-                + (dHi @ sigma @ Hi.T) * np.eye(len(DVi))
-                + (Hi @ symb_sigma @ Hi.T) * np.eye(len(DVi))
-                + (Hi @ sigma @ dHi.T) * np.eye(len(DVi))
-            )
-            grad_i = (
-                np.trace(Ci_inv @ dCi)
-                + (neg_dPi).T @ Ci_inv @ RESi
-                + RESi.T @ (-Ci_inv @ dCi @ Ci_inv @ RESi + Ci_inv @ (neg_dPi))
-            )
-            gradsum[i] += grad_i
+    exprs_func(theta, out=values)
+    eta_gradient, eps_gradient, pred, dG_dx_all, dH_dx_all, dP_dx_all = _split_values(
+        values, *sizes
+    )
+
+    # All rows of Gi and Hi are equal so Ci = a * J + b * I, where J is a matrix of ones.
+    # The inverse (Sherman-Morrison) and the determinant then have closed forms and
+    # Ci never needs to be built. a and b and their derivatives do not depend on the individual.
+    a = eta_gradient @ omega @ eta_gradient
+    b = eps_gradient @ sigma @ eps_gradient
+    if b <= 0.0:
+        return np.inf, np.zeros_like(x)
+    da = (
+        dG_dx_all @ (omega @ eta_gradient)
+        + (eta_gradient @ omega) @ dG_dx_all.T
+        + _matrix_gradient_terms(eta_gradient, omega_grads)
+    )
+    db = (
+        dH_dx_all @ (sigma @ eps_gradient)
+        + (eps_gradient @ sigma) @ dH_dx_all.T
+        + _matrix_gradient_terms(eps_gradient, sigma_grads)
+    )
+
+    # Sums over the observations of each individual
+    res = dv - pred
+    res_sum = np.add.reduceat(res, starts)
+    res_sq = np.add.reduceat(res**2, starts)
+
+    n = counts
+    d = b + n * a
+    c = a / d  # Ci_inv = (I - c * J) / b
+    # log(det(Ci)) = n * log(b) + log(1 + n * a / b) without forming b**n
+    logdet = n * np.log(b) + np.log1p(n * a / b)
+    OFVsum = np.sum(logdet + (res_sq - c * res_sum**2) / b)
+
+    # gradient calculation
+    # u = Ci_inv @ RESi, trace(Ci_inv @ dCi) and u.T @ dCi @ u with dCi = da * J + db * I
+    u_sum = res_sum / d
+    u_sq = (res_sq - 2 * c * res_sum**2 + c**2 * n * res_sum**2) / b**2
+    gradsum = (
+        da * (np.sum(n / d) - np.sum(u_sum**2))
+        + db * (np.sum(n * (1 - c)) / b - np.sum(u_sq))
+        - 2 * dP_dx_all * np.sum(u_sum)
+    )
 
     grad_scale = calculate_gradient_scale(
         theta_ucp,
@@ -216,10 +218,14 @@ def ofv_func(
     )
     grad = gradsum * grad_scale
 
-    print("OFV", OFVsum)
     return OFVsum, grad
 
 
+def _matrix_gradient_terms(v, grads):
+    # v.T @ dA/dx @ v for all parameters x
+    return np.array([0.0 if coord is None else v[coord[0]] * v[coord[1]] for coord in grads])
+
+
 def get_parameter_estimates(state):
     names = [s.name for s in state.parameter_symbols]
     values = list(state.theta)
@@ -1341,14 +1341,23 @@ def summarize_modelfit_results_from_entries(
     if all(me is None for me in mes):
         raise ValueError('All input results are empty')
 
-    summaries = []
+    summaries = [
+        get_model_entry_summary(me, include_all_execution_steps)
+        for me in mes
+        if me is not None and me.modelfit_results is not None
+    ]
+    return concat_model_summaries(summaries)
+
+
+def get_model_entry_summary(
+    me: ModelEntry, include_all_execution_steps: bool = False
+) -> pd.DataFrame:
+    summary = _get_model_result_summary(me, include_all_execution_steps)
+    summary.insert(0, 'description', me.model.description)
+    return summary
 
-    for me in mes:
-        if me is not None and me.modelfit_results is not None:
-            summary = _get_model_result_summary(me, include_all_execution_steps)
-            summary.insert(0, 'description', me.model.description)
-            summaries.append(summary)
 
+def concat_model_summaries(summaries: list[pd.DataFrame]) -> pd.DataFrame:
     with warnings.catch_warnings():
         # Needed because of warning in pandas 2.1.1
         warnings.filterwarnings(
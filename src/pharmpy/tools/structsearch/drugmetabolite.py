@@ -28,24 +28,19 @@ def create_drug_metabolite_models(
     peripheral_functions = {k: v for k, v in peripheral_functions.items() if len(k) == 3}
 
     # TODO: Update method for finding metabolite name
-    if (
-        model.statements.ode_system.find_compartment('METABOLITE')
-        and len(metabolite_functions) != 0
-    ):
+    has_metabolite = model.statements.ode_system.find_compartment('METABOLITE') is not None
+    if has_metabolite and len(metabolite_functions) != 0:
         raise NotImplementedError(
             'Metabolite transformation on drug metabolite models is not yet possible.'
             ' Either remove METABOLITE transformations from search space or use another input model'
         )
-    elif (
-        not model.statements.ode_system.find_compartment('METABOLITE')
-        and len(metabolite_functions) == 0
-    ):
+    elif not has_metabolite and len(metabolite_functions) == 0:
         raise ValueError(
             'Require at least one metabolite model type.'
             ' Try adding METABOLITE(BASIC) or METABOLITE(PSC) to search space'
         )
 
-    if model.statements.ode_system.find_compartment('METABOLITE'):
+    if has_metabolite:
         base_description = model.description
     else:
         base_description = determine_base_description(metabolite_functions, peripheral_functions)
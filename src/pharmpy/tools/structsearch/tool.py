@@ -206,16 +206,16 @@ def run_tmdd(
         rank_res_step_1.final_model, modelfit_results=rank_res_step_1.final_results
     )
 
+    best_qss_model = best_qss_entry.model
     models = create_remaining_models(
         model,
         best_qss_entry.modelfit_results.parameter_estimates,
-        len(best_qss_entry.model.statements.ode_system.find_peripheral_compartments()),
+        len(best_qss_model.statements.ode_system.find_peripheral_compartments()),
         dv_types,
         len(qss_candidate_entries),
     )
     remaining_model_entries = [
-        ModelEntry.create(model, modelfit_results=None, parent=best_qss_entry.model)
-        for model in models
+        ModelEntry.create(model, modelfit_results=None, parent=best_qss_model) for model in models
     ]
 
     wf2 = create_fit_workflow(remaining_model_entries)
@@ -334,12 +334,6 @@ def run_pkpd(
     baseline_pd_model = create_baseline_pd_model(input_model, results.parameter_estimates, b_init)
     baseline_pd_model_entry = ModelEntry.create(baseline_pd_model, modelfit_results=None)
 
-    wf = create_fit_workflow(baseline_pd_model_entry)
-    wb = WorkflowBuilder(wf)
-    task_results = Task('results2', bundle_results)
-    wb.add_task(task_results, predecessors=wf.output_tasks)
-    pd_baseline_fit = context.call_workflow(Workflow(wb), 'results_remaining')
-
     pkpd_models = create_pkpd_models(
         input_model,
         search_space,
@@ -354,11 +348,13 @@ def run_pkpd(
         for model in pkpd_models
     ]
 
-    wf2 = create_fit_workflow(pkpd_model_entries)
-    wb2 = WorkflowBuilder(wf2)
+    # The PKPD models do not depend on the fit of the baseline model so all are fitted together
+    wf = create_fit_workflow([baseline_pd_model_entry] + pkpd_model_entries)
+    wb = WorkflowBuilder(wf)
     task_results = Task('results2', bundle_results)
-    wb2.add_task(task_results, predecessors=wf2.output_tasks)
-    pkpd_models_fit = context.call_workflow(Workflow(wb2), 'results_remaining')
+    wb.add_task(task_results, predecessors=wf.output_tasks)
+    fits = context.call_workflow(Workflow(wb), 'results_remaining')
+    pd_baseline_fit, pkpd_models_fit = fits[:1], fits[1:]
 
     rank_res = rank_models(
         context,
@@ -172,6 +172,11 @@ class Context(ABC):
         """Store an annotation string (description) for a model"""
         pass
 
+    def store_annotations(self, annotations: dict[str, str]):
+        """Store annotation strings (descriptions) for multiple models"""
+        for name, annotation in annotations.items():
+            self.store_annotation(name, annotation)
+
     @abstractmethod
     def retrieve_annotation(self, name: str) -> str:
         """Retrieve an annotation for a model"""
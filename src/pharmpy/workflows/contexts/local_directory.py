@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import os.path
-from functools import partial
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Any, Literal, Optional
 
@@ -132,23 +132,23 @@ class LocalDirectoryContext(Context):
         res = read_results(self.path / 'results.json', model_deserialization_func=func)
         return res
 
-    @property
+    @cached_property
     def _log_path(self) -> Path:
         return self._top_path / 'log.csv'
 
-    @property
+    @cached_property
     def _metadata_path(self) -> Path:
         return self.path / 'metadata.json'
 
-    @property
+    @cached_property
     def _models_path(self) -> Path:
         return self.path / 'models'
 
-    @property
+    @cached_property
     def _annotations_path(self) -> Path:
         return self.path / 'annotations'
 
-    @property
+    @cached_property
     def context_path(self) -> str:
         relpath = self.path.relative_to(self._top_path.parent)
         posixpath = str(relpath.as_posix())
@@ -164,11 +164,12 @@ class LocalDirectoryContext(Context):
         if not self._metadata_path.is_file():
             return {}
         with open(self._metadata_path, 'r') as f:
-            return json.load(f, cls=MetadataJSONDecoder)
+            return json.load(f)
 
     def store_key(self, name: str, key: ModelHash):
         from_path = self._models_path / name
-        if not from_path.exists():
+        # NOTE: lexists since a link to a removed model entry should not be recreated
+        if not os.path.lexists(from_path):
             absolute_to_path = self.model_database.path / str(key)
             if absolute_to_path.exists():
                 if os.name != 'nt':
@@ -176,6 +177,8 @@ class LocalDirectoryContext(Context):
                 else:
                     relative_to_path = absolute_to_path
                 create_directory_symlink(from_path, relative_to_path)
+                if hasattr(self, '_name_by_digest'):
+                    self._name_by_digest.setdefault(str(key), name)
 
     def retrieve_key(self, name: str) -> ModelHash:
         symlink_path = self._models_path / name
@@ -189,45 +192,63 @@ class LocalDirectoryContext(Context):
         return key
 
     def list_all_names(self) -> list(str):
-        return sort_alphanum([f.name for f in Path(self._models_path).iterdir()])
+        with os.scandir(self._models_path) as it:
+            return sort_alphanum([entry.name for entry in it])
 
     def list_all_subcontexts(self) -> list(str):
         path = self.path / 'subcontexts'
-        return sort_alphanum([f.name for f in path.iterdir()])
+        with os.scandir(path) as it:
+            return sort_alphanum([entry.name for entry in it])
 
     def retrieve_name(self, key: ModelHash) -> str:
-        path = self._models_path
         mydigest = str(key)
-        for link_path in path.iterdir():
-            resolved = link_path.resolve()
-            digest = resolved.name
-            if digest == mydigest:
-                return link_path.name
-        raise KeyError(f"Model with key {mydigest} could not be found.")
+        names = getattr(self, '_name_by_digest', {})
+        if mydigest not in names:
+            # Links could have been added by other processes so rescan the directory
+            names = {}
+            with os.scandir(self._models_path) as it:
+                for entry in it:
+                    try:
+                        target = os.readlink(entry.path)
+                    except OSError:
+                        continue
+                    names.setdefault(os.path.basename(target), entry.name)
+            self._name_by_digest = names
+        try:
+            return names[mydigest]
+        except KeyError:
+            raise KeyError(f"Model with key {mydigest} could not be found.")
 
     def store_annotation(self, name: str, annotation: str):
+        self.store_annotations({name: annotation})
+
+    def store_annotations(self, annotations: dict[str, str]):
+        # NOTE: The file has one line per name. New names are appended and the file is only
+        # rewritten if an existing annotation is replaced.
         path = self._annotations_path
         with self._write_lock(path):
             with open(path, 'r') as fh:
-                lines = []
-                found = False
-                for line in fh.readlines():
-                    a = line.split(" ", 1)
-                    if a[0] == name:
-                        lines.append(f'{name} {annotation}\n')
-                        found = True
-                    else:
-                        lines.append(line)
-                if not found:
-                    lines.append(f'{name} {annotation}\n')
-            with open(path, 'w') as fh:
-                fh.writelines(lines)
+                lines = fh.readlines()
+            remaining = dict(annotations)
+            replaced = False
+            for i, line in enumerate(lines):
+                name = line.split(" ", 1)[0]
+                if name in remaining:
+                    lines[i] = f'{name} {remaining.pop(name)}\n'
+                    replaced = True
+            new_lines = [f'{name} {annotation}\n' for name, annotation in remaining.items()]
+            if replaced:
+                with open(path, 'w') as fh:
+                    fh.writelines(lines + new_lines)
+            else:
+                with open(path, 'a') as fh:
+                    fh.writelines(new_lines)
 
     def retrieve_annotation(self, name: str) -> str:
         path = self._annotations_path
         with self._read_lock(path):
             with open(path, 'r') as fh:
-                for line in fh.readlines():
+                for line in fh:
                     a = line.split(" ", 1)
                     if a[0] == name:
                         return a[1][:-1]
@@ -246,13 +267,31 @@ class LocalDirectoryContext(Context):
     def retrieve_log(self, level: Literal['all', 'current', 'lower'] = 'all') -> pd.DataFrame:
         log_path = self._log_path
         with self._read_lock(log_path):
-            df = pd.read_csv(log_path, parse_dates=['time'])
-        count = df['path'].str.count('/')
+            # Only parse the log again if it has changed since the last call. The log is
+            # append-only so if it has grown only the new lines need to be parsed.
+            stat = log_path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached_key, df, count = getattr(self, '_log_cache', (None, None, None))
+            if cached_key != key:
+                if df is not None and len(df) > 0 and cached_key[1] < key[1]:
+                    with open(log_path, 'r') as fh:
+                        fh.seek(cached_key[1])
+                        new_df = pd.read_csv(
+                            fh, header=None, names=df.columns, parse_dates=['time']
+                        )
+                    df = pd.concat([df, new_df], ignore_index=True)
+                    count = pd.concat([count, new_df['path'].str.count('/')], ignore_index=True)
+                else:
+                    df = pd.read_csv(log_path, parse_dates=['time'])
+                    count = df['path'].str.count('/')
+                self._log_cache = (key, df, count)
         curlevel = self.context_path.count('/')
         if level == 'lower':
             df = df.loc[count >= curlevel]
         elif level == 'current':
             df = df.loc[count == curlevel]
+        else:
+            df = df.copy()  # Do not hand out the cached DataFrame
         df = df.reset_index(drop=True)
         return df
 
@@ -346,14 +385,6 @@ class MetadataJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-class MetadataJSONDecoder(json.JSONDecoder):
-    def __init__(self, *args, **kwargs):
-        json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
-
-    def object_hook(self, obj):
-        return obj
-
-
 def _deserialize_model_from_hash(obj, key, modeldb):
     model = modeldb.retrieve_model(ModelHash(key))
     return model
@@ -1,8 +1,10 @@
 import json
+import os
 import shutil
 from contextlib import contextmanager
-from os import stat
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 from typing import Union
 
 from pharmpy.internals.fs.lock import path_lock
@@ -105,8 +107,7 @@ class LocalDirectoryDatabase(NonTransactionalModelDatabase):
         pass
 
     def store_local_file(self, model, path, new_filename=None):
-        path_object = Path(path)
-        if path_object.name not in self.ignored_names and path_object.is_file():
+        if os.path.basename(path) not in self.ignored_names and os.path.isfile(path):
             dest_path = self.path
             if new_filename:
                 dest_path = self.path / new_filename
@@ -114,13 +115,15 @@ class LocalDirectoryDatabase(NonTransactionalModelDatabase):
 
     def list_all_files(self, name):
         # Retrieve all files stored for one model
-        file_names = [f.name for f in self.path.glob(f'{name}.*') if f.is_file()]
+        prefix = f'{name}.'
+        with os.scandir(self.path) as it:
+            file_names = [e.name for e in it if e.name.startswith(prefix) and e.is_file()]
         return file_names
 
     def retrieve_file(self, name, filename, destination_path, force=False):
         # Return path to file
         path = self.path / filename
-        if path.is_file() and stat(path).st_size > 0:
+        if _is_nonempty_file(path):
             if (
                 destination_path.is_file() or (destination_path / filename).is_file()
             ) and force is not True:
@@ -142,7 +145,6 @@ class LocalDirectoryDatabase(NonTransactionalModelDatabase):
     def retrieve_model(self, name):
         filename = name + self.file_extension
         path = self.path / filename
-        from pharmpy.model import Model
 
         try:
             model = Model.parse_model(path)
@@ -156,7 +158,7 @@ class LocalDirectoryDatabase(NonTransactionalModelDatabase):
 
     def retrieve_model_entry(self, name):
         model = self.retrieve_model(name)
-        modelfit_results = self.retrieve_modelfit_results(name)
+        modelfit_results = get_modelfit_results(model, self.path)
         return create_model_entry(model, modelfit_results)
 
     def store_metadata(self, model, metadata):
@@ -192,25 +194,33 @@ class LocalModelDirectoryDatabase(TransactionalModelDatabase):
         path.mkdir(parents=True, exist_ok=True)
         self.path = path_absolute(path)
         self.file_extension = file_extension
+        self._lock_path = self.path / FILE_LOCK
+        # NOTE: Keys for which the metadata directory is known to exist. Model directories are
+        # never removed by the database.
+        self._created_keys = set()
 
     def _read_lock(self):
         # NOTE: Obtain shared (blocking) lock on the entire database
-        path = self.path / FILE_LOCK
-        path.touch(exist_ok=True)
-        return path_lock(str(path), shared=True)
+        self._lock_path.touch(exist_ok=True)
+        return path_lock(str(self._lock_path), shared=True)
 
     def _write_lock(self):
         # NOTE: Obtain exclusive (blocking) lock on the entire database
-        path = self.path / FILE_LOCK
-        path.touch(exist_ok=True)
-        return path_lock(str(path), shared=False)
+        self._lock_path.touch(exist_ok=True)
+        return path_lock(str(self._lock_path), shared=False)
+
+    def _metadata_directory(self, key: ModelHash) -> Path:
+        digest = str(key)
+        destination = self.path / digest / DIRECTORY_PHARMPY_METADATA
+        if digest not in self._created_keys:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._created_keys.add(digest)
+        return destination
 
     @contextmanager
     def snapshot(self, obj: Union[Model, ModelEntry, ModelHash]):
         key = ModelHash(obj)
-        model_path = self.path / str(key)
-        destination = model_path / DIRECTORY_PHARMPY_METADATA
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = self._metadata_directory(key)
         with self._read_lock():
             # NOTE: Check that no pending transaction exists
             path = destination / FILE_PENDING
@@ -223,9 +233,7 @@ class LocalModelDirectoryDatabase(TransactionalModelDatabase):
     @contextmanager
     def transaction(self, obj: Union[Model, ModelEntry, ModelHash]):
         key = ModelHash(obj)
-        model_path = self.path / str(key)
-        destination = model_path / DIRECTORY_PHARMPY_METADATA
-        destination.mkdir(parents=True, exist_ok=True)
+        destination = self._metadata_directory(key)
         with self._write_lock():
             # NOTE: Mark state as pending
             path = destination / FILE_PENDING
@@ -261,14 +269,18 @@ class LocalModelDirectoryDatabaseTransaction(ModelTransaction):
         # matching this hash only
         h = self.key.dataset_hash
         h_dir = datasets_path / DIRECTORY_INDEX / str(h)
+        hpath = None
         if h_dir.is_dir():
-            hpath = next(h_dir.iterdir())
+            # NOTE: The index directory can be empty if a previous store was interrupted
+            with os.scandir(h_dir) as it:
+                hpath = next(it, None)
+        if hpath is not None:
             # NOTE: This variable holds a string similar to "run1.csv"
             matching_model_filename = hpath.name
             data_path = datasets_path / matching_model_filename
             dipath = data_path.with_suffix('.datainfo')
             # TODO: Maybe catch FileNotFoundError and similar here (pass)
-            curdi = DataInfo.read_json(dipath)
+            curdi = _read_datainfo(dipath)
             # NOTE: Paths are not compared here
             if curdi == model.datainfo:
                 datainfo = model.datainfo.replace(path=curdi.path)
@@ -277,12 +289,13 @@ class LocalModelDirectoryDatabaseTransaction(ModelTransaction):
             h_dir.mkdir(parents=True, exist_ok=True)
 
             highest = 0
-            for file in datasets_path.iterdir():
-                name = file.name
-                if name.startswith('data') and name.endswith('.csv'):
-                    number = int(name[4:-4])  # Remove data and .csv
-                    if number > highest:
-                        highest = number
+            with os.scandir(datasets_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('data') and name.endswith('.csv'):
+                        number = int(name[4:-4])  # Remove data and .csv
+                        if number > highest:
+                            highest = number
 
             dataset_basename = f'data{highest + 1}'
             dataset_filename = f'{dataset_basename}.csv'
@@ -317,7 +330,7 @@ class LocalModelDirectoryDatabaseTransaction(ModelTransaction):
         destination = self.database.path / str(self.key) / DIRECTORY_PHARMPY_METADATA
         destination.mkdir(parents=True, exist_ok=True)
         with open(destination / FILE_METADATA, 'w') as f:
-            json.dump(metadata, f, indent=2)
+            f.write(json.dumps(metadata))
 
     def store_modelfit_results(self):
         destination = self.database.path / str(self.key) / DIRECTORY_PHARMPY_METADATA
@@ -339,7 +352,8 @@ class LocalModelDirectoryDatabaseTransaction(ModelTransaction):
 class LocalModelDirectoryDatabaseSnapshot(ModelSnapshot):
     def list_all_files(self):
         path = self.database.path / str(self.key)
-        file_names = [f.name for f in path.iterdir() if f.is_file()]
+        with os.scandir(path) as it:
+            file_names = [e.name for e in it if e.is_file()]
         if len(file_names) > 0:
             return file_names
         else:
@@ -348,7 +362,7 @@ class LocalModelDirectoryDatabaseSnapshot(ModelSnapshot):
     def retrieve_file(self, filename, destination_path, force=False):
         # Return path to file
         path = self.database.path / str(self.key) / filename
-        if path.is_file() and stat(path).st_size > 0:
+        if _is_nonempty_file(path):
             if (
                 destination_path.is_file() or (destination_path / filename).is_file()
             ) and force is not True:
@@ -378,6 +392,11 @@ class LocalModelDirectoryDatabaseSnapshot(ModelSnapshot):
         return model
 
     def _find_full_model_path(self):
+        # NOTE: The snapshot is only valid under the read lock so the path can be kept
+        path = getattr(self, '_model_path', None)
+        if path is not None:
+            return path
+
         extensions = ('.mod', '.ctl')
         root = self.database.path / str(self.key)
         errors = []
@@ -387,6 +406,7 @@ class LocalModelDirectoryDatabaseSnapshot(ModelSnapshot):
             path = root / filename
 
             if path.is_file():
+                self._model_path = path
                 return path
             else:
                 errors.append(path)
@@ -397,7 +417,9 @@ class LocalModelDirectoryDatabaseSnapshot(ModelSnapshot):
             )
 
     def retrieve_modelfit_results(self):
-        model = self.retrieve_model()
+        return self._retrieve_modelfit_results(self.retrieve_model())
+
+    def _retrieve_modelfit_results(self, model):
         path = self._find_full_model_path()
         res = get_modelfit_results(model, path)
 
@@ -417,5 +439,24 @@ class LocalModelDirectoryDatabaseSnapshot(ModelSnapshot):
 
     def retrieve_model_entry(self):
         model = self.retrieve_model()
-        modelfit_results = self.retrieve_modelfit_results()
+        modelfit_results = self._retrieve_modelfit_results(model)
         return create_model_entry(model, modelfit_results)
+
+
+def _is_nonempty_file(path: Path) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return S_ISREG(st.st_mode) and st.st_size > 0
+
+
+def _read_datainfo(path: Path) -> DataInfo:
+    # NOTE: DataInfo is immutable so parsed files can be shared as long as they are unchanged
+    st = os.stat(path)
+    return _read_datainfo_cached(path, (st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=64)
+def _read_datainfo_cached(path: Path, stat_key: tuple[int, int]) -> DataInfo:
+    return DataInfo.read_json(path)
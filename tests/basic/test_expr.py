@@ -17,6 +17,7 @@ def test_init_expr():
 def test_symbol():
     expr = Expr.symbol("CL")
     assert expr.name == "CL"
+    assert Expr.symbol("CL") is expr
     expr = Expr.integer(1)
     with pytest.raises(ValueError):
         expr.name
@@ -64,6 +64,26 @@ def load_model_for_test(tmp_path_factory):
     return _load
 
 
+@pytest.fixture(scope='session')
+def read_modelfit_results_for_test():
+    from pharmpy.tools import read_modelfit_results
+    from pharmpy.workflows import ModelfitResults
+
+    _cache: Dict[Hashable, ModelfitResults] = {}
+
+    def _read(given_path: Union[str, Path]) -> ModelfitResults:
+        from pharmpy.tools.external.nonmem import conf
+
+        key = (str(conf), str(Path(given_path).resolve()))
+
+        if key not in _cache:
+            _cache[key] = read_modelfit_results(given_path)
+
+        return _cache[key]
+
+    return _read
+
+
 @pytest.fixture(scope='session')
 def load_example_model_for_test():
     from pharmpy.model import Model
@@ -22,6 +22,7 @@ from pharmpy.internals.math import (
     is_positive_semidefinite,
     nearest_positive_definite,
     nearest_positive_semidefinite,
+    positive_semidefinite_factors,
     round_and_keep_sum,
     round_to_n_sigdig,
     se_delta_method,
@@ -141,6 +142,16 @@ def test_nearest_posdef():
     assert (nearest_positive_definite(A) == A).all()
 
 
+def test_positive_semidefinite_factors():
+    A = np.array([[[2.0, -1.0], [-1.0, 2.0]], [[1.0, 2.0], [2.0, 1.0]]])
+    F = positive_semidefinite_factors(A)
+    assert F.shape == (2, 2, 2)
+    assert_allclose(F[0] @ F[0].T, A[0])
+    B = F[1] @ F[1].T
+    assert is_positive_semidefinite(B)
+    assert_allclose(B, np.array([[1.5, 1.5], [1.5, 1.5]]))
+
+
 def test_conditional_joint_normal():
     sigma = [
         [0.0419613930249351, 0.0194493895550238, -0.00815616219453746, 0.0943578658777171],
@@ -185,3 +196,8 @@ def test_conditional_joint_normal_lambda():
 
     assert (mu_1 == mu_2).all()
     assert (sigma_1 == sigma_2).all()
+
+    cjn = conditional_joint_normal_lambda(mu, WGT_sigma, len(mu) - 1)
+    mu_rows, _ = cjn(np.array([[WGT_5th], [WGT_mean]]))
+    np.testing.assert_allclose(mu_rows[0], cjn(np.array([WGT_5th]))[0])
+    np.testing.assert_allclose(mu_rows[1], cjn(np.array([WGT_mean]))[0])
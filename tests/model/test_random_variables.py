@@ -516,6 +516,32 @@ def test_validate_parameters():
         rvs.validate_parameters({})
 
 
+def test_validate_parameter_samples():
+    a, b, c, d = (symbol('a'), symbol('b'), symbol('c'), symbol('d'))
+    dist1 = JointNormalDistribution.create(
+        ['ETA(1)', 'ETA(2)'],
+        'iiv',
+        [0, 0],
+        [[a, b], [b, c]],
+    )
+    dist2 = NormalDistribution.create('ETA(3)', 'iiv', 0.5, d)
+    rvs = RandomVariables.create([dist1, dist2])
+    samples = np.array([[2, 0.1, 1, 23], [2, 2, 1, 23], [1, 0, 1, 1]])
+    valid = rvs.validate_parameter_samples(['a', 'b', 'c', 'd'], samples)
+    assert list(valid) == [True, False, True]
+
+    dist3 = JointNormalDistribution.create(
+        ['ETA(1)', 'ETA(2)'],
+        'iiv',
+        [0, 0],
+        [[a, 2 * b], [2 * b, c]],
+    )
+    rvs = RandomVariables.create([dist3])
+    samples = np.array([[2, 0.1, 1], [2, 1, 1]])
+    valid = rvs.validate_parameter_samples(['a', 'b', 'c'], samples)
+    assert list(valid) == [True, False]
+
+
 def test_sample():
     dist = JointNormalDistribution.create(
         ['ETA(1)', 'ETA(2)'],
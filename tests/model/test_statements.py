@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import pytest
 
 from pharmpy.basic import Expr, Matrix
@@ -59,6 +63,11 @@ def test_subs(load_model_for_test, testdata):
 
     assert s4.ode_system.free_symbols == {S('CL'), S('AMT'), S('t'), S('V2')}
 
+    s5 = s4.subs({'NOT_USED': 'X'})
+    assert s5 == s4
+    assert s5[0] is s4[0]
+    assert s5.ode_system is s4.ode_system
+
 
 def test_ode_free_symbols(load_model_for_test, testdata):
     model = load_model_for_test(testdata / 'nonmem' / 'pheno_real.mod')
@@ -66,6 +75,32 @@ def test_ode_free_symbols(load_model_for_test, testdata):
     assert model.statements.ode_system.free_symbols == {S('V'), S('CL'), S('AMT'), S('t')}
 
 
+def test_free_symbols_cached():
+    a = Assignment.create('CL', 'POP_CL + ETA_CL')
+    symbs = a.free_symbols
+    assert symbs == {S('CL'), S('POP_CL'), S('ETA_CL')}
+    symbs.add(S('X'))
+    assert a.free_symbols == {S('CL'), S('POP_CL'), S('ETA_CL')}
+    rhs = a.rhs_symbols
+    rhs.clear()
+    assert a.rhs_symbols == {S('POP_CL'), S('ETA_CL')}
+
+    dose = Infusion.create('AMT', rate='RATE')
+    comp = Compartment.create('CENTRAL', doses=(dose,), lag_time='ALAG')
+    assert comp.free_symbols == {S('AMT'), S('RATE'), S('ALAG')}
+    comp.free_symbols.clear()
+    assert comp.free_symbols == {S('AMT'), S('RATE'), S('ALAG')}
+
+    cb = CompartmentalSystemBuilder()
+    cb.add_compartment(comp)
+    cb.add_flow(comp, output, S('CL') / S('V'))
+    cs = CompartmentalSystem(cb)
+    ref = {S('AMT'), S('RATE'), S('ALAG'), S('CL'), S('V'), S('t')}
+    assert cs.free_symbols == ref
+    cs.free_symbols.clear()
+    assert cs.free_symbols == ref
+
+
 def test_lhs_symbols(load_example_model_for_test):
     model = load_example_model_for_test("pheno")
     assert model.statements.lhs_symbols == {
@@ -158,11 +193,96 @@ def test_hash():
     c2 = Compartment.create("DEPOT")
     assert hash(c1) != hash(c2)
     assert hash(c1) != hash(output)
+    c3 = Compartment.create("DEPOT", lag_time="ALAG")
+    assert c1 == c3 and hash(c1) == hash(c3)
+    assert len({c1, c2, c3}) == 2
 
     st1 = Statements((s1, s2))
     st2 = Statements((s1,))
     assert hash(st1) != hash(st2)
 
+    cb = CompartmentalSystemBuilder()
+    cb.add_compartment(c1)
+    cb.add_flow(c1, output, 'CL/V')
+    cs1 = CompartmentalSystem(cb)
+    cs2 = CompartmentalSystem(cb)
+    assert cs1 == cs2
+    assert hash(cs1) == hash(cs2)
+    cb.add_flow(c1, output, 'K')
+    cs3 = CompartmentalSystem(cb)
+    assert cs1 != cs3
+    assert hash(cs1) != hash(cs3)
+
+
+def _run_with_hash_seed(seed, code, stdin=b''):
+    env = dict(os.environ, PYTHONHASHSEED=str(seed))
+    result = subprocess.run(
+        [sys.executable, '-c', code], input=stdin, env=env, capture_output=True, check=True
+    )
+    return result.stdout
+
+
+def _compare_across_hash_seeds(build_code):
+    # Objects are hashed and pickled with one str hash seed and then compared to freshly
+    # created objects in a process using another seed
+    dump_code = (
+        build_code
+        + """
+import pickle
+objs = build()
+for obj, fresh in zip(objs, build()):
+    hash(obj)
+    assert obj == fresh
+sys.stdout.buffer.write(pickle.dumps(objs))
+"""
+    )
+    load_code = (
+        build_code
+        + """
+import pickle
+objs = pickle.loads(sys.stdin.buffer.read())
+for obj, fresh in zip(objs, build()):
+    print(obj == fresh, fresh == obj, obj in {fresh}, fresh in {obj})
+"""
+    )
+    pickled = _run_with_hash_seed(1, 'import sys\n' + dump_code)
+    return _run_with_hash_seed(2, 'import sys\n' + load_code, stdin=pickled).decode().split()
+
+
+def test_hash_pickle_across_processes():
+    build_code = """
+from pharmpy.basic import Expr
+from pharmpy.model import Assignment, Bolus, Compartment, Infusion, Statements
+
+def build():
+    bolus = Bolus(Expr.symbol('AMT'))
+    infusion = Infusion.create('AMT', rate='R1')
+    comp = Compartment.create('CENTRAL', doses=(bolus, infusion), lag_time='ALAG')
+    sset = Statements((Assignment(Expr.symbol('CL'), Expr.symbol('THETA_1')),))
+    return (bolus, infusion, comp, sset)
+"""
+    assert _compare_across_hash_seeds(build_code) == ['True'] * 16
+
+
+def test_compartmental_system_pickle_across_processes():
+    build_code = """
+from pharmpy.basic import Expr
+from pharmpy.model import Bolus, Compartment, CompartmentalSystem, CompartmentalSystemBuilder
+from pharmpy.model import output
+
+def build():
+    cb = CompartmentalSystemBuilder()
+    depot = Compartment.create('DEPOT', doses=(Bolus(Expr.symbol('AMT')),))
+    central = Compartment.create('CENTRAL')
+    cb.add_compartment(depot)
+    cb.add_compartment(central)
+    cb.add_flow(depot, central, Expr.symbol('KA'))
+    cb.add_flow(central, output, Expr.symbol('CL') / Expr.symbol('V'))
+    cs = CompartmentalSystem(cb)
+    return (cs, cs.find_compartment('DEPOT'))
+"""
+    assert _compare_across_hash_seeds(build_code) == ['True'] * 8
+
 
 def test_dict(load_model_for_test, testdata):
     ass1 = Assignment(S('KA'), S('X') + S('Y'))
@@ -394,6 +514,9 @@ def test_statements_create():
     sset3 = Statements.create(sset1)
     assert sset1 == sset3
 
+    graph = sset2._create_dependency_graph()
+    assert Statements(sset2)._create_dependency_graph() is graph
+
     sset4 = Statements.create(None)
     assert len(sset4) == 0
 
@@ -432,6 +555,7 @@ def test_remove_symbol_definition():
     s = Statements([s1, s2, s3, s4, s5])
     ns = s.remove_symbol_definitions([Expr.symbol('CL')], s4)
     assert ns == Statements([s1, s2, s3, s4, s5])
+    assert s.remove_symbol_definitions([Expr.symbol('NOT_DEFINED')], s4) is s
 
     s1 = Assignment(S('K'), Expr.integer(16))
     s2 = Assignment(S('CL'), Expr.integer(23))
@@ -466,6 +590,7 @@ def test_reassign():
     assert snew == Statements([s1, s2, s3, Assignment(S('KA'), S('F'))])
     snew = s.reassign('KA', 'F')
     assert snew == Statements([s1, s2, s3, Assignment(S('KA'), S('F'))])
+    assert s.reassign('NOT_ASSIGNED', 'F') == s
 
 
 def test_find_compartment(load_model_for_test, testdata):
@@ -651,6 +776,8 @@ def test_before_odes(load_model_for_test, pheno_path):
     model = load_model_for_test(pheno_path)
     before_ode = model.statements.before_odes
     assert before_ode[-1].symbol.name == 'S1'
+    assert model.statements.before_odes is before_ode
+    assert model.statements.after_odes is model.statements.after_odes
 
 
 def test_full_expression(load_model_for_test, pheno_path):
@@ -660,6 +787,20 @@ def test_full_expression(load_model_for_test, pheno_path):
     with pytest.raises(ValueError):
         model.statements.full_expression("Y")
 
+    s = Statements(
+        (
+            Assignment(S('X'), S('A') + 1),
+            Assignment(S('Y'), S('X') * 2),
+            Assignment(S('X'), S('X') + S('Y')),
+            Assignment(S('Z'), S('X') + S('B')),
+        )
+    )
+    assert s.full_expression('Z') == 3 * (S('A') + 1) + S('B')
+    assert s.full_expression('X') == 3 * (S('A') + 1)
+    assert s[:2].full_expression('X') == S('A') + 1
+    assert s.full_expression('C') == S('C')
+    assert s.full_expression('Z') is s.full_expression('Z')
+
 
 def test_to_explicit_ode_system(load_model_for_test, pheno_path):
     model = load_model_for_test(pheno_path)
@@ -800,6 +941,16 @@ def test_dependencies(load_model_for_test, pheno_path):
     with pytest.raises(KeyError):
         model.statements.dependencies("NONEXISTING")
 
+    s = Statements(
+        (
+            Assignment(S('X'), S('A') + 1),
+            Assignment(S('Y'), S('X') * 2),
+            Assignment(S('Z'), S('B')),
+        )
+    )
+    assert s.dependencies(S('Y')) == {S('A')}
+    assert s.dependencies(S('Z')) == {S('B')}
+
 
 def test_builder():
     cb = CompartmentalSystemBuilder()
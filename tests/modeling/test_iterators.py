@@ -36,13 +36,13 @@ def test_omit(df):
 
 
 def test_resampler_default(df):
-    np.random.seed(28)
-    resampler = iters.Resample(df, 'ID')
+    rng = np.random.default_rng(28)
+    resampler = iters.Resample(df, 'ID', seed=rng)
     (new_df, ids) = next(resampler)
-    assert ids == [1, 4, 2]
+    assert ids == [4, 2, 1]
     assert list(new_df['ID']) == [1, 1, 2, 2, 3, 3]
-    assert list(new_df['DV']) == [5, 6, 0, 9, 3, 4]
-    assert list(new_df['STRAT']) == [1, 1, 2, 2, 2, 2]
+    assert list(new_df['DV']) == [0, 9, 3, 4, 5, 6]
+    assert list(new_df['STRAT']) == [2, 2, 2, 2, 1, 1]
     assert new_df.name == 'resample_1'
     with pytest.raises(StopIteration):  # Test the default one iteration
         next(resampler)
@@ -54,51 +54,57 @@ def test_resampler_too_big_sample_size(df):
 
 
 def test_resampler_noreplace(df):
-    np.random.seed(28)
-    resampler = iters.Resample(df, 'ID', replace=False, sample_size=3)
+    rng = np.random.default_rng(28)
+    resampler = iters.Resample(df, 'ID', replace=False, sample_size=3, seed=rng)
     next(resampler)
 
-    resampler = iters.Resample(df, 'ID', stratify='STRAT')
+    resampler = iters.Resample(df, 'ID', stratify='STRAT', seed=rng)
     (new_df, ids) = next(resampler)
     assert ids == [1, 2, 4]
     assert list(new_df['ID']) == [1, 1, 2, 2, 3, 3]
     assert list(new_df['DV']) == [5, 6, 3, 4, 0, 9]
 
-    resampler = iters.Resample(df, 'ID', replace=False, sample_size=2)
+    resampler = iters.Resample(df, 'ID', replace=False, sample_size=2, seed=rng)
     (new_df, ids) = next(resampler)
-    assert list(ids) == [2, 1]
+    assert list(ids) == [1, 2]
     assert list(new_df['ID']) == [1, 1, 2, 2]
 
 
 def test_stratification(df):
-    np.random.seed(28)
+    rng = np.random.default_rng(28)
     resampler = iters.Resample(
-        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2, 2: 3}, replace=True
+        df,
+        'ID',
+        resamples=1,
+        stratify='STRAT',
+        sample_size={1: 2, 2: 3},
+        replace=True,
+        seed=rng,
     )
     (new_df, ids) = next(resampler)
-    assert ids == [1, 1, 4, 4, 4]
+    assert ids == [1, 1, 4, 4, 2]
     assert list(new_df['ID']) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
-    assert list(new_df['DV']) == [5, 6, 5, 6, 0, 9, 0, 9, 0, 9]
+    assert list(new_df['DV']) == [5, 6, 5, 6, 0, 9, 0, 9, 3, 4]
 
     resampler = iters.Resample(
-        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2}, replace=True
+        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2}, replace=True, seed=rng
     )
     (new_df, ids) = next(resampler)
     assert ids == [1, 1]
 
-    resampler = iters.Resample(df, 'ID', resamples=3, stratify='STRAT', replace=True)
+    resampler = iters.Resample(df, 'ID', resamples=3, stratify='STRAT', replace=True, seed=rng)
     (new_df, ids) = next(resampler)
-    assert ids == [1, 2, 2]
+    assert ids == [1, 4, 4]
     (new_df, ids) = next(resampler)
-    assert ids == [1, 2, 4]
+    assert ids == [1, 4, 4]
     (new_df, ids) = next(resampler)
-    assert ids == [1, 4, 2]
+    assert ids == [1, 2, 2]
 
 
 def test_resampler_anonymization(testdata):
-    np.random.seed(28)
+    rng = np.random.default_rng(28)
     df = pd.read_csv(testdata / 'pheno_data.csv')
-    resampler = iters.Resample(df, group='ID')
+    resampler = iters.Resample(df, group='ID', seed=rng)
     (new_df, ids) = next(resampler)
     assert all(e in ids for e in range(1, 60))
     assert len(ids) == 59
@@ -73,8 +73,8 @@ def test_sample_individual_estimates(load_model_for_test, testdata):
     samples = sample_individual_estimates(model, ie, iec, seed=rng)
     assert len(samples) == 59 * 100
     assert list(samples.columns) == ['ETA_1', 'ETA_2']
-    assert pytest.approx(samples.iloc[0]['ETA_1'], 1e-5) == 0.21179186940672637
-    assert pytest.approx(samples.iloc[0]['ETA_2'], 1e-5) == -0.05771736555248238
+    assert pytest.approx(samples.iloc[0]['ETA_1'], 1e-5) == 0.01801122610845294
+    assert pytest.approx(samples.iloc[0]['ETA_2'], 1e-5) == 0.13157434035957224
 
     restricted = sample_individual_estimates(
         model, ie, iec, parameters=['ETA_2'], samples_per_id=1, seed=rng
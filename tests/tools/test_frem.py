@@ -8,7 +8,6 @@ from pytest import approx
 
 import pharmpy.tools as tools
 from pharmpy.deps import pandas as pd
-from pharmpy.tools import read_modelfit_results
 from pharmpy.tools.frem.models import calculate_parcov_inits, create_model3b
 from pharmpy.tools.frem.results import (
     calculate_results,
@@ -46,9 +45,10 @@ def test_check_covariates_mult_warns(load_model_for_test, testdata):
     assert newcov == []
 
 
-def test_parcov_inits(load_model_for_test, testdata):
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_parcov_inits(load_model_for_test, read_modelfit_results_for_test, testdata):
     model = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_3.mod')
-    res = read_modelfit_results(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_3.mod')
+    res = read_modelfit_results_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_3.mod')
     params = calculate_parcov_inits(model, res.individual_estimates, 2)
     assert params == approx(
         {
@@ -60,9 +60,12 @@ def test_parcov_inits(load_model_for_test, testdata):
     )
 
 
-def test_create_model3b(load_model_for_test, testdata):
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_create_model3b(load_model_for_test, read_modelfit_results_for_test, testdata):
     model3 = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_3.mod')
-    model3_res = read_modelfit_results(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_3.mod')
+    model3_res = read_modelfit_results_for_test(
+        testdata / 'nonmem' / 'frem' / 'pheno' / 'model_3.mod'
+    )
     model1b = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_1b.mod')
     model3b = create_model3b(model1b, model3, model3_res, 2)
     pset = model3b.parameters
@@ -71,23 +74,29 @@ def test_create_model3b(load_model_for_test, testdata):
     assert model3b.name == 'model_3b'
 
 
-def test_bipp_covariance(load_model_for_test, testdata):
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_bipp_covariance(load_model_for_test, read_modelfit_results_for_test, testdata):
     model = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
-    res = read_modelfit_results(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
+    res = read_modelfit_results_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
     res = calculate_results_using_bipp(
         model, res, continuous=['APGR', 'WGT'], categorical=[], seed=9532
     )
     assert res
 
 
-def test_frem_results_pheno(load_model_for_test, testdata):
+@pytest.fixture(scope='module')
+def frem_results_pheno(load_model_for_test, read_modelfit_results_for_test, testdata):
     model = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
-    res = read_modelfit_results(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
+    res = read_modelfit_results_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
     rng = np.random.default_rng(39)
-    res = calculate_results(
+    return calculate_results(
         model, res, continuous=['APGR', 'WGT'], categorical=[], samples=10, seed=rng
     )
 
+
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_frem_results_pheno_covariate_effects(frem_results_pheno):
+    res = frem_results_pheno
     correct = """parameter,covariate,condition,p5,mean,p95
 CL,APGR,5th,0.7796529929324229,0.8867711881110598,1.0237174754763725
 CL,APGR,95th,0.9895148609293414,1.062539375981661,1.1255598889265175
@@ -103,6 +112,10 @@ V,WGT,95th,1.0675663716554031,1.1615592500763623,1.2535787989945573
     correct.index.set_names(['parameter', 'covariate', 'condition'], inplace=True)
     pd.testing.assert_frame_equal(res.covariate_effects, correct)
 
+
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_frem_results_pheno_individual_effects(frem_results_pheno):
+    res = frem_results_pheno
     correct = """ID,parameter,observed,p5,p95
 1,CL,0.5547432549476109,0.4201938943885976,0.6486041435973237
 1,V,1.8160960655979352,1.5159727720524636,2.4087602613533137
@@ -227,6 +240,10 @@ V,WGT,95th,1.0675663716554031,1.1615592500763623,1.2535787989945573
     correct.index.set_names(['ID', 'parameter'], inplace=True)
     pd.testing.assert_frame_equal(res.individual_effects, correct)
 
+
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_frem_results_pheno_unexplained_variability(frem_results_pheno):
+    res = frem_results_pheno
     correct = """parameter,covariate,sd_observed,sd_5th,sd_95th
 CL,none,0.1983559931033091,0.12946065353375166,0.2571110819074169
 CL,APGR,0.19362660786608385,0.12480254721683472,0.2435502440034818
@@ -241,6 +258,10 @@ V,all,0.14574143997630676,0.11964944422449278,0.16136355952455325
     correct.index.set_names(['parameter', 'covariate'], inplace=True)
     pd.testing.assert_frame_equal(res.unexplained_variability, correct)
 
+
+@pytest.mark.xdist_group(name="frem_pheno")
+def test_frem_results_pheno_covariate_statistics(frem_results_pheno):
+    res = frem_results_pheno
     correct = pd.DataFrame(
         {
             'p5': [1.0, 0.7],
@@ -257,9 +278,11 @@ V,all,0.14574143997630676,0.11964944422449278,0.16136355952455325
     pd.testing.assert_frame_equal(res.covariate_statistics, correct)
 
 
-def test_frem_results_pheno_categorical(load_model_for_test, testdata):
+def test_frem_results_pheno_categorical(
+    load_model_for_test, read_modelfit_results_for_test, testdata
+):
     model = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno_cat' / 'model_4.mod')
-    res = read_modelfit_results(testdata / 'nonmem' / 'frem' / 'pheno_cat' / 'model_4.mod')
+    res = read_modelfit_results_for_test(testdata / 'nonmem' / 'frem' / 'pheno_cat' / 'model_4.mod')
     rng = np.random.default_rng(8978)
     res = calculate_results(
         model, res, continuous=['WGT'], categorical=['APGRX'], samples=10, seed=rng
@@ -434,6 +457,7 @@ V,all,0.14415324601826981,0.12550789602518891,0.1698873910362707
     pd.testing.assert_frame_equal(res.covariate_statistics, correct)
 
 
+@pytest.mark.xdist_group(name="frem_pheno")
 def test_get_params(load_model_for_test, create_model_for_test, testdata):
     model_frem = load_model_for_test(testdata / 'nonmem' / 'frem' / 'pheno' / 'model_4.mod')
     dist = model_frem.random_variables.etas[-1]
@@ -1,7 +1,11 @@
 import numpy as np
+import pandas as pd
 import pytest
+from scipy.stats import multivariate_normal
 
 from pharmpy.basic import Expr
+from pharmpy.modeling import set_dataset
+from pharmpy.tools.modelfit.estimation import init
 from pharmpy.tools.modelfit.evaluation import (
     evaluate_model,
     get_functions_to_solve_for,
@@ -131,3 +135,37 @@ def test_evaluate_model(load_example_model_for_test):
     print(res)
     assert res.loc[0, 'Y'] == pytest.approx(17.695056, abs=1e-5)
     assert res.loc[743, 'Y'] == pytest.approx(34.411508, abs=1e-5)
+
+
+def test_ofv_func(load_model_for_test, testdata):
+    model = load_model_for_test(testdata / 'nonmem' / 'minimal.mod')
+    df = pd.DataFrame(
+        {
+            'ID': [1, 1, 1, 2, 2, 3],
+            'DV': [1.0, 2.0, 1.5, 3.0, 1.0, 0.5],
+            'TIME': [0.0, 1.0, 2.0, 0.0, 1.0, 0.0],
+        }
+    )
+    model = set_dataset(model, df, datatype='nonmem')
+    x0, func, state = init(model)
+
+    for x in (x0, 0.5 * x0, x0 + np.array([0.3, -0.2, 0.1])):
+        ofv, grad = func(x)
+
+        # -2LL without the constant term with Ci = OMEGA * J + SIGMA * I
+        ref_ofv = 0.0
+        for _, obs in df.groupby('ID'):
+            n = len(obs)
+            cov = state.omega[0, 0] * np.ones((n, n)) + state.sigma[0, 0] * np.eye(n)
+            dist = multivariate_normal(mean=np.full(n, state.theta[0]), cov=cov)
+            ref_ofv += -2.0 * dist.logpdf(obs['DV']) - n * np.log(2.0 * np.pi)
+        assert ofv == pytest.approx(ref_ofv, rel=1e-12)
+
+        h = 1e-6
+        ref_grad = [(func(x + h * e)[0] - func(x - h * e)[0]) / (2.0 * h) for e in np.eye(len(x))]
+        assert np.allclose(grad, ref_grad, rtol=1e-6)
+
+    # A sigma that underflows to zero gives a singular covariance matrix
+    ofv, grad = func(np.array([0.1, 0.1, -1000.0]))
+    assert ofv == np.inf
+    assert list(grad) == [0.0, 0.0, 0.0]
@@ -1,6 +1,6 @@
 import pytest
 
-from pharmpy.modeling import create_rng
+from pharmpy.modeling import create_rng, set_initial_estimates
 from pharmpy.tools import load_example_modelfit_results
 from pharmpy.workflows import LocalDirectoryContext
 from pharmpy.workflows.hashing import ModelHash
@@ -95,6 +95,9 @@ def test_log(tmp_path):
     assert len(df) == 1
     df = ctx.retrieve_log(level='current')
     assert len(df) == 2
+    df = ctx.retrieve_log()
+    df.loc[0, 'message'] = 'Changed'
+    assert ctx.retrieve_log().loc[0, 'message'] == "This didn't work"
 
     s = 'String, with, commas'
     s2 = '"Quoted"'
@@ -104,6 +107,9 @@ def test_log(tmp_path):
     df = ctx.retrieve_log()
     assert df.loc[3, 'message'] == s
     assert df.loc[4, 'message'] == s2
+    fresh = LocalDirectoryContext(name='mycontext', ref=tmp_path).retrieve_log()
+    assert df.equals(fresh)
+    assert df['time'].dtype == fresh['time'].dtype
 
 
 def test_results(tmp_path, testdata):
@@ -151,8 +157,20 @@ def test_key(tmp_path, load_example_model_for_test):
     assert isinstance(key, ModelHash)
     name = ctx.retrieve_name(key)
     assert name == "pheno"
+    model2 = set_initial_estimates(model, {'POP_CL': 0.1}).replace(name="pheno2")
+    ctx.store_model_entry(model2)
+    assert ctx.retrieve_name(ctx.retrieve_key("pheno2")) == "pheno2"
+    assert ctx.retrieve_name(key) == "pheno"
     annotation = ctx.retrieve_annotation("pheno")
     assert annotation.startswith("PHENOBARB")
+    ctx.store_annotation("pheno", "first")
+    ctx.store_annotations({"pheno": "second", "pheno2": "other"})
+    assert ctx.retrieve_annotation("pheno") == "second"
+    assert ctx.retrieve_annotation("pheno2") == "other"
+    names = [line.split(" ", 1)[0] for line in (ctx.path / 'annotations').read_text().splitlines()]
+    assert sorted(names) == ["pheno", "pheno2"]
+    with pytest.raises(KeyError):
+        ctx.retrieve_annotation("pheno3")
 
 
 def test_create_rng(tmp_path):
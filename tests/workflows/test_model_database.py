@@ -99,6 +99,31 @@ def test_store_model(tmp_path, load_model_for_test, testdata):
             assert line == f'$DATA ..{sep}.datasets{sep}data2.csv IGNORE=@\n'
 
 
+def test_store_model_empty_index(tmp_path, load_model_for_test, testdata):
+    with chdir(tmp_path):
+        model = load_model_for_test(testdata / 'nonmem' / 'pheno_real.mod')
+        db = LocalModelDirectoryDatabase("database")
+        h = ModelHash(model)
+        index_path = Path("database") / ".datasets" / ".hash" / str(h.dataset_hash)
+        index_path.mkdir(parents=True)
+
+        db.store_model(model)
+
+        assert (Path("database") / ".datasets" / "data1.csv").is_file()
+        assert (index_path / "data1.csv").is_file()
+
+
+def test_store_model_removed_lock_file(tmp_path, load_model_for_test, testdata):
+    with chdir(tmp_path):
+        model = load_model_for_test(testdata / 'nonmem' / 'pheno_real.mod')
+        db = LocalModelDirectoryDatabase("database")
+        (Path("database") / ".lock").unlink(missing_ok=True)
+
+        db.store_model(model)
+
+        assert (Path("database") / ".lock").is_file()
+
+
 def test_store_and_retrieve_model_entry(tmp_path, load_model_for_test, testdata):
     sep = os.path.sep
     with chdir(tmp_path):